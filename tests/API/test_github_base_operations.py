@@ -81,6 +81,7 @@ class TestGithubOperations:
 
     @allure.story("Branch Management")
     @allure.title("Test branch creation in repository")
+    @pytest.mark.depends_on("test_repository_creation")
     def test_branch_creation(self):
         """
         Test verifies that a new branch can be created in the repository
@@ -97,6 +98,7 @@ class TestGithubOperations:
 
     @allure.story("Content Management")
     @allure.title("Test committing and pushing content")
+    @pytest.mark.depends_on("test_branch_creation")
     def test_commit_push(self):
         """
         Test verifies that content can be committed and pushed to a branch
@@ -119,6 +121,7 @@ class TestGithubOperations:
 
     @allure.story("Pull Request Management")
     @allure.title("Test pull request creation and verification")
+    @pytest.mark.depends_on("test_commit_push")
     def test_pull_request_creation(self):
         """
         Test verifies that a pull request can be created and contains
@@ -0,0 +1,326 @@
+import base64
+import json
+import time
+import pytest
+import allure
+import requests
+from tests.api_helpers.fake_github import FakeGitHubServer
+from tests.api_helpers.git_helpers import blob_sha
+from tests.api_helpers.github_client import GitHubClient
+from tests.api_helpers.rate_limit import RateLimitGovernor
+from tests.api_helpers.tracing import Tracer
+
+USERNAME = "octocat"
+HEADERS = {
+    'Authorization': 'token fake-token',
+    'Accept': 'application/vnd.github.v3+json'
+}
+
+@pytest.fixture
+def fake_github():
+    """Fake GitHub API of a single test, independent of BASE_URL."""
+    server = FakeGitHubServer(USERNAME)
+    server.start()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def request_tracer():
+    """Tracer recording every request, used to count requests sent by a test."""
+    return Tracer(sample_rate=1.0)
+
+@pytest.fixture
+def client(fake_github, request_tracer):
+    """Client talking to the fake GitHub API of the test."""
+    with GitHubClient(
+        HEADERS,
+        base_url=fake_github.base_url,
+        request_tracer=request_tracer,
+        latency_recorder=None
+    ) as github_client:
+        yield github_client
+
+def create_repositories(client: GitHubClient, count: int) -> list:
+    """
+    Creates repositories named repo-00, repo-01, ...
+
+    Args:
+        client (GitHubClient): Client to create them with
+        count (int): Number of repositories
+
+    Returns:
+        list: Names of the created repositories, in listing order
+    """
+    return [client.create_new_repository(f"repo-{index:02d}") for index in range(count)]
+
+def rate_limit_response(status: int, headers: dict, message: str = "") -> requests.Response:
+    """
+    Builds a GitHub response without sending a request.
+
+    Args:
+        status (int): Status code
+        headers (dict): Response headers
+        message (str): Error message of the JSON body
+
+    Returns:
+        requests.Response: Response object
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    response._content = json.dumps({"message": message}).encode() if message else b""
+    return response
+
+def timed_acquire(governor: RateLimitGovernor, times: int = 1) -> float:
+    """
+    Acquires the governor repeatedly.
+
+    Args:
+        governor (RateLimitGovernor): Governor to acquire
+        times (int): Number of requests to take from the budget
+
+    Returns:
+        float: Elapsed seconds
+    """
+    started = time.monotonic()
+    for _ in range(times):
+        governor.acquire()
+    return time.monotonic() - started
+
+@allure.epic("GitHub API Operations")
+@allure.feature("GitHub Client")
+@allure.story("Pagination")
+class TestPagination:
+    """Pages of list endpoints are followed through the Link header."""
+
+    def test_iter_pages_follows_link_header(self, client):
+        names = create_repositories(client, 5)
+
+        pages = list(client.iter_pages("/user/repos", per_page=2))
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [repo['name'] for page in pages for repo in page] == names
+
+    def test_iter_items_passes_params_to_first_page_only(self, client, request_tracer):
+        create_repositories(client, 3)
+        mark = request_tracer.mark()
+
+        items = list(client.iter_items("/user/repos", params={"sort": "full_name"}, per_page=1))
+
+        urls = [trace.url for trace in request_tracer.since(mark)]
+        assert len(items) == 3
+        assert len(urls) == 3
+        # The next links carry the query parameters, they must not be repeated
+        assert all(url.count("per_page=") == 1 for url in urls), urls
+        assert all("sort=full_name" in url for url in urls), urls
+
+    def test_iter_items_fetches_pages_lazily(self, client, request_tracer):
+        names = create_repositories(client, 5)
+        mark = request_tracer.mark()
+
+        for repo in client.iter_items("/user/repos", per_page=2):
+            if repo['name'] == names[2]:
+                break
+
+        # repo-02 is on the second of three pages
+        assert len(request_tracer.since(mark)) == 2
+
+    def test_repository_lookup_finds_repository(self, client):
+        names = create_repositories(client, 3)
+
+        repo = client.verify_repository_in_user_repos(USERNAME, names[1])
+
+        assert repo['name'] == names[1]
+
+    def test_repository_lookup_fails_for_missing_repository(self, client):
+        create_repositories(client, 3)
+
+        with pytest.raises(AssertionError, match="was not found"):
+            client.verify_repository_in_user_repos(USERNAME, "missing-repo")
+
+@allure.epic("GitHub API Operations")
+@allure.feature("GitHub Client")
+@allure.story("Conditional Requests")
+class TestConditionalCache:
+    """Repeated GET requests are revalidated with the cached ETag."""
+
+    def test_unchanged_listing_is_revalidated(self, client, request_tracer):
+        create_repositories(client, 2)
+        first = client.get("/user/repos")
+        mark = request_tracer.mark()
+
+        second = client.get("/user/repos")
+
+        assert [trace.status for trace in request_tracer.since(mark)] == [304]
+        assert second.status_code == 200
+        assert getattr(second, "from_cache", False)
+        assert second.json() == first.json()
+        assert client.cache.hits == 1
+
+    def test_repository_creation_invalidates_listing(self, client, request_tracer):
+        create_repositories(client, 1)
+        client.get("/user/repos")
+        key = client.cache.key("/user/repos")
+        assert client.cache.validators(key)
+
+        client.create_new_repository("new-repo")
+
+        assert client.cache.validators(key) == {}
+        mark = request_tracer.mark()
+        listing = client.get("/user/repos")
+        assert [trace.status for trace in request_tracer.since(mark)] == [200]
+        assert not getattr(listing, "from_cache", False)
+        assert len(listing.json()) == 2
+
+    def test_write_keeps_other_repositories_cached(self, client):
+        first, second = create_repositories(client, 2)
+        client.get(f"/repos/{USERNAME}/{first}")
+        client.get(f"/repos/{USERNAME}/{second}")
+
+        client.commit_files(USERNAME, first, "main", {"notes.txt": "notes"}, "Add notes")
+
+        assert client.cache.validators(client.cache.key(f"/repos/{USERNAME}/{first}")) == {}
+        assert client.cache.validators(client.cache.key(f"/repos/{USERNAME}/{second}"))
+
+    def test_deleted_repository_is_not_served_from_cache(self, client):
+        name, = create_repositories(client, 1)
+        assert client.get_repository(USERNAME, name) is not None
+
+        client.delete_repository(USERNAME, name)
+
+        assert client.get_repository(USERNAME, name) is None
+
+@allure.epic("GitHub API Operations")
+@allure.feature("GitHub Client")
+@allure.story("Rate Limit Governor")
+class TestRateLimitGovernor:
+    """Workers sharing a token draw from one budget kept in a state file."""
+
+    def test_burst_is_not_paced(self, tmp_path):
+        governor = RateLimitGovernor("burst", rate=1, burst=5, state_dir=str(tmp_path))
+
+        assert timed_acquire(governor, 5) < 0.5
+
+    def test_requests_beyond_burst_are_paced(self, tmp_path):
+        governor = RateLimitGovernor("pacing", rate=20, burst=2, state_dir=str(tmp_path))
+
+        # Two tokens of the burst, then one token per 50 ms
+        assert timed_acquire(governor, 4) >= 0.09
+
+    def test_budget_is_shared_through_state_file(self, tmp_path):
+        first = RateLimitGovernor("shared", rate=2, burst=1, state_dir=str(tmp_path))
+        second = RateLimitGovernor("shared", rate=2, burst=1, state_dir=str(tmp_path))
+        other = RateLimitGovernor("other", rate=2, burst=1, state_dir=str(tmp_path))
+
+        first.acquire()
+
+        assert timed_acquire(other) < 0.25
+        assert timed_acquire(second) >= 0.45
+
+    def test_retry_after_pauses_all_governors(self, tmp_path):
+        first = RateLimitGovernor("retry", rate=0, state_dir=str(tmp_path))
+        second = RateLimitGovernor("retry", rate=0, state_dir=str(tmp_path))
+        response = rate_limit_response(
+            429,
+            {"Retry-After": "1"},
+            "You have exceeded a secondary rate limit"
+        )
+
+        delay = first.update(response)
+
+        assert delay == pytest.approx(1, abs=0.1)
+        with open(first.state_path) as state_file:
+            assert json.load(state_file)["paused_until"] > time.time()
+        assert timed_acquire(second) >= 0.9
+
+    def test_exhausted_limit_pauses_until_reset(self, tmp_path):
+        governor = RateLimitGovernor("reset", rate=0, state_dir=str(tmp_path))
+        reset = int(time.time()) + 30
+        response = rate_limit_response(
+            403,
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)},
+            "API rate limit exceeded"
+        )
+
+        delay = governor.update(response)
+
+        assert delay == pytest.approx(reset + 1 - time.time(), abs=1)
+
+    def test_other_errors_do_not_pause(self, tmp_path):
+        governor = RateLimitGovernor("forbidden", rate=0, state_dir=str(tmp_path))
+        response = rate_limit_response(
+            403,
+            {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": str(int(time.time()) + 3600)},
+            "Resource not accessible by integration"
+        )
+
+        assert governor.update(response) is None
+        assert timed_acquire(governor) < 0.5
+        with open(governor.state_path) as state_file:
+            assert json.load(state_file)["remaining"] == 4000
+
+    def test_client_retries_after_rate_limit(self, tmp_path, monkeypatch):
+        governor = RateLimitGovernor("client", rate=0, state_dir=str(tmp_path))
+        responses = [
+            rate_limit_response(429, {"Retry-After": "0"}, "You have exceeded a secondary rate limit"),
+            rate_limit_response(200, {})
+        ]
+        with GitHubClient(
+            HEADERS,
+            base_url="https://api.github.invalid",
+            cache=False,
+            request_tracer=None,
+            latency_recorder=None
+        ) as client:
+            client.governor = governor
+            monkeypatch.setattr(client, "_traced", lambda *args, **kwargs: responses.pop(0))
+
+            response = client.get("/user")
+
+        assert response.status_code == 200
+        assert responses == []
+
+@allure.epic("GitHub API Operations")
+@allure.feature("GitHub Client")
+@allure.story("Fake GitHub API")
+class TestCommitFiles:
+    """Commits created through the Git data API of the fake."""
+
+    def test_commit_files_creates_tree_and_moves_ref(self, client, request_tracer):
+        name, = create_repositories(client, 1)
+        parent = client.get_ref(USERNAME, name, "heads/main")
+        files = {"docs/guide.md": "# Guide\n", "data/values.txt": "1\n2\n"}
+        mark = request_tracer.mark()
+
+        commit = client.commit_files(USERNAME, name, "main", files, "Add guide and values")
+
+        assert len(request_tracer.since(mark)) == len(files) + 4
+        assert commit['message'] == "Add guide and values"
+        assert [item['sha'] for item in commit['parents']] == [parent]
+        assert client.get_ref(USERNAME, name, "heads/main") == commit['sha']
+
+        tree = client.get(f"/repos/{USERNAME}/{name}/git/trees/{commit['tree']['sha']}").json()
+        entries = {entry['path']: entry for entry in tree['tree']}
+        assert sorted(entries) == ["README.md", "data/values.txt", "docs/guide.md"]
+        for path, content in files.items():
+            assert entries[path]['mode'] == "100644"
+            assert entries[path]['sha'] == blob_sha(content)
+            blob = client.get(f"/repos/{USERNAME}/{name}/git/blobs/{entries[path]['sha']}").json()
+            assert base64.b64decode(blob['content']).decode() == content
+
+    def test_commit_files_replaces_existing_file(self, client):
+        name, = create_repositories(client, 1)
+        client.commit_files(USERNAME, name, "main", {"README.md": "first\n"}, "First")
+
+        commit = client.commit_files(USERNAME, name, "main", {"README.md": "second\n"}, "Second")
+
+        tree = client.get(f"/repos/{USERNAME}/{name}/git/trees/{commit['tree']['sha']}").json()
+        assert [(entry['path'], entry['sha']) for entry in tree['tree']] == [
+            ("README.md", blob_sha("second\n"))
+        ]
+
+    def test_commit_files_requires_existing_branch(self, client):
+        name, = create_repositories(client, 1)
+
+        with pytest.raises(AssertionError, match="Failed to get branch reference"):
+            client.commit_files(USERNAME, name, "missing", {"a.txt": "a"}, "Add a")
@@ -2,22 +2,24 @@ import os
 import pytest
 import logging
 import allure
-from tests.api_helpers.git_helpers import clone_repository, verify_repository_content
-from tests.api_helpers.github_helpers import (
-    create_new_repository,
-    push_commit_to_branch,
-    delete_repository
+import git
+from tests.api_helpers.git_helpers import (
+    GIT_REMOTE_BASE,
+    clone_repository,
+    create_local_repository,
+    delete_local_repository,
+    find_content_mismatches,
+    is_local_remote,
+    push_files
 )
-from tests.GUI.pages.login_page import LoginPage
+from tests.api_helpers.github_helpers import push_commit_to_branch
 
 # Environment variables
 GITHUB_API_KEY = os.getenv("GITHUB_API_KEY")
 GITHUB_USERNAME = os.getenv("GITHUB_USERNAME")
-GITHUB_PASSWORD = os.getenv("GITHUB_PASSWORD")
 BASE_URL = os.getenv("BASE_URL", "https://github.com")
 
 # Test constants
-TEST_REPO_NAME = "test-git-operations"
 TEST_FILE_CONTENT = "print('HelloGit')"
 TEST_FILE_PATH = "test_script.py"
 TEST_README_CONTENT = "# Test Repository\n\nThis is a test repository."
@@ -26,44 +28,49 @@ TEST_PR_TITLE = "Update README.md"
 TEST_PR_BODY = "Automated PR for testing"
 
 @pytest.fixture(scope="class")
-def test_repo_setup():
-    """Fixture to create and cleanup test repository"""
-    repo_name = TEST_REPO_NAME
-    
-    with allure.step("Setup test repository"):
+def github_repo_setup(repo_pool):
+    """Fixture to lease a pooled test repository, which is reset on release"""
+    with repo_pool.leased() as repository:
+        with allure.step("Setup test repository"):
+            push_commit_to_branch(
+                headers={"Authorization": f"token {GITHUB_API_KEY}"},
+                username=GITHUB_USERNAME,
+                repo_name=repository.name,
+                branch_name="main",
+                file_content=TEST_FILE_CONTENT,
+                commit_message="Added sample Python file",
+                file_path=TEST_FILE_PATH
+            )
+
+        yield repository.name
+
+@pytest.fixture(scope="class")
+def local_repo_setup(worker_id):
+    """Fixture to seed a repository on the local GIT_REMOTE_BASE, like github_repo_setup"""
+    repo_name = f"git-operations-{worker_id}"
+    with allure.step("Setup local test repository"):
         try:
-            delete_repository(
-                {"Authorization": f"token {GITHUB_API_KEY}"}, 
-                GITHUB_USERNAME, 
-                repo_name
+            create_local_repository(GITHUB_USERNAME, repo_name)
+            push_files(
+                username=GITHUB_USERNAME,
+                repo_name=repo_name,
+                branch_name="main",
+                files={TEST_FILE_PATH: TEST_FILE_CONTENT},
+                commit_message="Added sample Python file"
             )
-        except Exception as e:
-            logging.info(f"Repository doesn't exist or couldn't be deleted: {e}")
-        
-        create_new_repository(
-            headers={"Authorization": f"token {GITHUB_API_KEY}"},
-            repo_name=repo_name,
-            description="Test repository for git operations"
-        )
-        
-        push_commit_to_branch(
-            headers={"Authorization": f"token {GITHUB_API_KEY}"},
-            username=GITHUB_USERNAME,
-            repo_name=repo_name,
-            branch_name="main",
-            file_content=TEST_FILE_CONTENT,
-            commit_message="Added sample Python file",
-            file_path=TEST_FILE_PATH
-        )
-    
+        except git.GitCommandError as e:
+            pytest.skip(f"Cannot seed {repo_name} on {GIT_REMOTE_BASE}: {e.stderr.strip()}")
+
     yield repo_name
-    
-    #Cleanup after test
-    delete_repository(
-        {"Authorization": f"token {GITHUB_API_KEY}"}, 
-        GITHUB_USERNAME, 
-        repo_name
-    )
+
+    delete_local_repository(GITHUB_USERNAME, repo_name)
+
+@pytest.fixture(scope="class")
+def test_repo_setup(request):
+    """Fixture to provide the seeded test repository of the configured git remote"""
+    if is_local_remote():
+        return request.getfixturevalue("local_repo_setup")
+    return request.getfixturevalue("github_repo_setup")
 
 @pytest.mark.usefixtures("test_repo_setup")
 class TestGitOperations:
@@ -74,28 +81,26 @@ class TestGitOperations:
         repo_name = test_repo_setup
         
         with allure.step("Clone and verify repository"):
+            expected_files = {"README.md": None, TEST_FILE_PATH: TEST_FILE_CONTENT}
             repo_path = clone_repository(
                 username=GITHUB_USERNAME,
                 repo_name=repo_name,
                 target_dir=str(tmp_path),
-                token=GITHUB_API_KEY
+                token=GITHUB_API_KEY,
+                filter_spec="blob:none",
+                sparse_paths=list(expected_files),
+                use_mirror=True
             )
             
-            expected_files = ["README.md", TEST_FILE_PATH]
-            assert verify_repository_content(repo_path, expected_files), \
-                "Repository content verification failed"
-            
-            with open(os.path.join(repo_path, TEST_FILE_PATH), "r") as f:
-                content = f.read()
-            assert content == TEST_FILE_CONTENT, \
-                f"{TEST_FILE_PATH} content does not match expected"
+            mismatches = find_content_mismatches(git.Repo(repo_path), expected_files)
+            assert not mismatches, \
+                f"Repository content verification failed: {'; '.join(mismatches)}"
 
     @allure.title("Test branch creation and PR workflow")
     def test_push_changes(self, test_repo_setup, tmp_path):
         """Test creating a branch, pushing changes, and creating PR."""
         from tests.GUI.pages.merge_page import MergePage
         from tests.api_helpers.github_helpers import create_pull_request
-        import git
         
         repo_name = test_repo_setup
         
@@ -104,7 +109,8 @@ class TestGitOperations:
                 username=GITHUB_USERNAME,
                 repo_name=repo_name,
                 target_dir=str(tmp_path),
-                token=GITHUB_API_KEY
+                token=GITHUB_API_KEY,
+                use_mirror=True
             )
             
             repo = git.Repo(repo_path)
@@ -116,7 +122,12 @@ class TestGitOperations:
             repo.index.add(['README.md'])
             repo.index.commit("Update README.md")
             repo.git.push('--set-upstream', 'origin', TEST_BRANCH_NAME)
-            
+
+        if is_local_remote():
+            # Pull requests need GitHub, the push is all a local remote verifies
+            return
+
+        with allure.step("Create pull request"):
             create_pull_request(
                 headers={"Authorization": f"token {GITHUB_API_KEY}"},
                 username=GITHUB_USERNAME,
@@ -128,29 +139,22 @@ class TestGitOperations:
             )
 
     @allure.title("Test PR merge via UI")
-    def test_merge_pr(self, test_repo_setup):
-        """Test merging pull request via UI."""
-        from playwright.sync_api import Page, sync_playwright
+    @pytest.mark.depends_on("test_push_changes")
+    @pytest.mark.skipif(is_local_remote(), reason="GIT_REMOTE_BASE is a local remote, there is no pull request to merge")
+    def test_merge_pr(self, test_repo_setup, page):
+        """Test merging pull request via UI, logged in through the cached storage state."""
         from tests.GUI.pages.merge_page import MergePage
         
         repo_name = test_repo_setup
         
         with allure.step("Merge pull request"):
-            with sync_playwright() as playwright:
-                browser = playwright.chromium.launch()
-                page = browser.new_page()
-                try:
-                    login_page = LoginPage(page)
-                    login_page.login(GITHUB_USERNAME, GITHUB_PASSWORD)
-                    merge_page = MergePage(page)
-                    merge_page.validate_and_merge_pr(
-                        username=GITHUB_USERNAME,
-                        repo_name=repo_name,
-                        content=TEST_PR_BODY,
-                        pr_description=TEST_PR_TITLE
-                    )
-                finally:
-                    browser.close()
+            merge_page = MergePage(page)
+            merge_page.validate_and_merge_pr(
+                username=GITHUB_USERNAME,
+                repo_name=repo_name,
+                content=TEST_PR_BODY,
+                pr_description=TEST_PR_TITLE
+            )
 
         
         
\ No newline at end of file
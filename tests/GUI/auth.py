@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from playwright.sync_api import Browser
+from tests.GUI.pages.login_page import LoginPage
+
+# Seconds a cached storage state is reused before logging in again
+AUTH_STATE_MAX_AGE = float(os.getenv("AUTH_STATE_MAX_AGE", str(8 * 3600)))
+
+# Cookie holding the GitHub login session
+SESSION_COOKIE = "user_session"
+
+# Minimum remaining lifetime of the session cookie in seconds
+EXPIRY_MARGIN = 300
+
+
+def storage_state_path(username: str) -> Path:
+    """
+    Returns the cache file of a user's storage state, unique per xdist worker.
+
+    Args:
+        username (str): GitHub username
+
+    Returns:
+        Path: Storage state file in the system temp directory
+    """
+    digest = hashlib.sha256(username.encode("utf-8")).hexdigest()[:16]
+    worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+    return Path(tempfile.gettempdir()) / "github-auth" / f"{digest}-{worker}.json"
+
+
+def is_storage_state_valid(path: Path, max_age: float = AUTH_STATE_MAX_AGE) -> bool:
+    """
+    Checks that a cached storage state is recent and its session cookie
+    does not expire soon.
+
+    Args:
+        path (Path): Storage state file
+        max_age (float): Maximum age of the file in seconds
+
+    Returns:
+        bool: True if the storage state can be reused
+    """
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return False
+        cookies = json.loads(path.read_text())["cookies"]
+    except (OSError, ValueError, KeyError):
+        return False
+    for cookie in cookies:
+        if cookie["name"] == SESSION_COOKIE:
+            expires = cookie.get("expires", -1)
+            return expires < 0 or expires > time.time() + EXPIRY_MARGIN
+    return False
+
+
+def write_storage_state(path: Path, state: dict) -> None:
+    """
+    Writes a storage state, which holds live session cookies, readable by
+    the current user only. The file is written under a temporary name and
+    renamed, so it is never visible with partial content or wider permissions.
+
+    Args:
+        path (Path): Storage state file
+        state (dict): Storage state of a browser context
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkdir leaves the permissions of an existing directory unchanged
+    path.parent.chmod(0o700)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    # The mode only applies to new files, a leftover could be wider
+    tmp_path.unlink(missing_ok=True)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "w") as state_file:
+            json.dump(state, state_file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def login_storage_state(
+    browser: Browser,
+    username: str,
+    password: str,
+    path: Path = None,
+    max_age: float = AUTH_STATE_MAX_AGE
+) -> str:
+    """
+    Returns an authenticated storage state, logging in through LoginPage
+    only when the cached one is missing or expired.
+
+    Args:
+        browser (Browser): Browser used for the login
+        username (str): GitHub username
+        password (str): GitHub password
+        path (Path): Cache file (default: storage_state_path(username))
+        max_age (float): Maximum age of the cached state in seconds
+
+    Returns:
+        str: Path of the storage state file, usable as storage_state of a context
+    """
+    path = path or storage_state_path(username)
+    if is_storage_state_valid(path, max_age):
+        logging.info(f"Reusing cached login state: {path}")
+        return str(path)
+
+    context = browser.new_context()
+    try:
+        LoginPage(context.new_page()).login(username, password)
+        state = context.storage_state()
+    finally:
+        context.close()
+    write_storage_state(path, state)
+    logging.info(f"Stored login state: {path}")
+    return str(path)
@@ -0,0 +1,190 @@
+import fnmatch
+import os
+import re
+from collections import Counter
+from typing import Iterable, List, Pattern, Union
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Request, Response, Route
+
+# Route filtering is enabled for all browser contexts unless set to false
+NETWORK_FILTER = os.getenv("NETWORK_FILTER", "true").lower() == "true"
+
+# Resource types Playwright reports for requests
+RESOURCE_TYPES = {
+    "document", "stylesheet", "image", "media", "font", "script", "texttrack",
+    "xhr", "fetch", "eventsource", "websocket", "manifest", "other"
+}
+
+# Resource types no assertion looks at
+BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+
+# URLs of requests of a resource type, so only those are routed through Python.
+# Types missing here can only be recognised by routing every request.
+RESOURCE_TYPE_URLS = {
+    "image": re.compile(r"\.(png|jpe?g|gif|svg|webp|avif|ico)(\?|#|$)", re.IGNORECASE),
+    "media": re.compile(r"\.(mp4|webm|ogg|mp3|wav|m4a)(\?|#|$)", re.IGNORECASE),
+    "font": re.compile(r"\.(woff2?|ttf|otf|eot)(\?|#|$)", re.IGNORECASE),
+    "stylesheet": re.compile(r"\.css(\?|#|$)", re.IGNORECASE),
+    "script": re.compile(r"\.m?js(\?|#|$)", re.IGNORECASE)
+}
+
+# Image hosts serving URLs without file extension, e.g. avatars, and telemetry
+# and analytics hosts, answered with an empty response
+BLOCKED_HOSTS = (
+    "avatars.githubusercontent.com",
+    "camo.githubusercontent.com",
+    "user-images.githubusercontent.com",
+    "private-user-images.githubusercontent.com",
+    "collector.github.com",
+    "*.google-analytics.com",
+    "*.googletagmanager.com",
+    "*.doubleclick.net"
+)
+
+
+def host_url_pattern(host: str) -> Pattern:
+    """
+    Converts a shell-style host pattern into a regular expression matching
+    URLs of that host, which Playwright evaluates without calling Python.
+
+    Args:
+        host (str): Host pattern, e.g. *.google-analytics.com
+
+    Returns:
+        Pattern: URL pattern
+    """
+    host_regex = "[^/:?#]*".join(re.escape(part) for part in host.split("*"))
+    return re.compile(rf"^[a-z][a-z0-9+.-]*://([^/@]*@)?{host_regex}(:\d+)?([/?#]|$)", re.IGNORECASE)
+
+
+class RouteFilter:
+    """
+    Blocks resource types and hosts of a browser context and counts what
+    was blocked and loaded.
+
+    Entries of allow and deny lists are either Playwright resource types
+    (e.g. image) or shell-style host patterns (e.g. *.githubusercontent.com).
+    Allow entries take precedence over deny entries and the defaults.
+
+    Only requests whose URL matches a denied host or the file extensions of
+    a denied resource type are routed, all other traffic stays in the
+    browser. Denying a type without typical extensions (e.g. xhr) routes
+    every request through Python. Note that Playwright disables the HTTP
+    cache of a context as soon as any route is registered, so cached
+    scripts and stylesheets are fetched again on each navigation; set
+    NETWORK_FILTER=false when that costs more than the blocked requests save.
+    """
+
+    def __init__(
+        self,
+        allow: Iterable[str] = (),
+        deny: Iterable[str] = (),
+        blocked_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+        blocked_hosts: Iterable[str] = BLOCKED_HOSTS
+    ):
+        """
+        Initialize RouteFilter.
+
+        Args:
+            allow (Iterable[str]): Resource types or hosts never blocked
+            deny (Iterable[str]): Resource types or hosts blocked in addition
+            blocked_types (Iterable[str]): Resource types blocked by default
+            blocked_hosts (Iterable[str]): Host patterns blocked by default
+        """
+        self.allow = list(allow)
+        self.deny = [*blocked_types, *blocked_hosts, *deny]
+        self.blocked: Counter = Counter()
+        self.loaded_requests = 0
+        self.loaded_bytes = 0
+
+    @staticmethod
+    def _matches(entries: Iterable[str], request: Request) -> bool:
+        host = urlsplit(request.url).hostname or ""
+        for entry in entries:
+            if entry in RESOURCE_TYPES:
+                if request.resource_type == entry:
+                    return True
+            elif fnmatch.fnmatchcase(host, entry):
+                return True
+        return False
+
+    def is_blocked(self, request: Request) -> bool:
+        """
+        Checks whether a request is blocked.
+
+        Args:
+            request (Request): Intercepted request
+
+        Returns:
+            bool: True if the request is blocked
+        """
+        return not self._matches(self.allow, request) and self._matches(self.deny, request)
+
+    def handle(self, route: Route) -> None:
+        request = route.request
+        if not self.is_blocked(request):
+            route.continue_()
+            return
+        self.blocked[request.resource_type] += 1
+        if request.resource_type in ("image", "media", "font"):
+            route.abort("blockedbyclient")
+        else:
+            # Beacons and scripts get an empty answer so pages do not log errors
+            route.fulfill(status=204, body="")
+
+    def _on_response(self, response: Response) -> None:
+        self.loaded_requests += 1
+        self.loaded_bytes += int(response.headers.get("content-length", 0) or 0)
+
+    def url_patterns(self) -> List[Union[str, Pattern]]:
+        """
+        Returns the URL patterns routed through the filter.
+
+        Returns:
+            List[Union[str, Pattern]]: Playwright URL matchers
+        """
+        patterns = []
+        for entry in self.deny:
+            if entry in RESOURCE_TYPES:
+                if entry not in RESOURCE_TYPE_URLS:
+                    return ["**/*"]
+                patterns.append(RESOURCE_TYPE_URLS[entry])
+            else:
+                patterns.append(host_url_pattern(entry))
+        return patterns
+
+    def attach(self, context: BrowserContext) -> "RouteFilter":
+        """
+        Routes the requests of a browser context that may be blocked
+        through the filter.
+
+        Args:
+            context (BrowserContext): Browser context
+
+        Returns:
+            RouteFilter: The filter itself
+        """
+        for pattern in self.url_patterns():
+            context.route(pattern, self.handle)
+        context.on("response", self._on_response)
+        return self
+
+    def summary(self) -> str:
+        """
+        Renders the blocked and loaded request counts. Blocked bytes are not
+        known: blocked requests never reach the server, so no response size
+        is ever reported for them.
+
+        Returns:
+            str: Summary text
+        """
+        blocked = ", ".join(
+            f"{resource_type}: {count}" for resource_type, count in self.blocked.most_common()
+        )
+        return (
+            f"Blocked {sum(self.blocked.values())} requests ({blocked or 'none'}), "
+            f"their size is unknown as they are never sent\n"
+            f"Loaded {self.loaded_requests} responses, "
+            f"{self.loaded_bytes / 1024:.0f} KiB by Content-Length"
+        )
@@ -1,5 +1,6 @@
 from playwright.sync_api import Page, expect
 import os
+from tests.GUI.waits import click_and_wait_for_url
 
 
 class MergePage:
@@ -56,28 +57,26 @@ class MergePage:
         self.page.goto(f"{self.base_url}/{username}/{repo_name}/pulls")
         self.page.wait_for_load_state("load")
 
+        pr_url = f"**/{username}/{repo_name}/pull/*"
+
         # Open the PR
         expect(self.pr_link).to_be_visible()
-        self.pr_link.click()
-        self.page.wait_for_timeout(500)
+        click_and_wait_for_url(self.pr_link, pr_url)
 
         # Validate changes
         expect(
             self.page.get_by_text(pr_description).first
         ).to_be_visible()
-        self.files_changed_tab.click()
-        self.page.wait_for_timeout(500)
+        click_and_wait_for_url(self.files_changed_tab, f"{pr_url}/files")
         expect(
             self.page.get_by_text(content).first
         ).to_be_visible()
 
-        # Merge PR
-        self.conversation_tab.click()
-        self.page.wait_for_timeout(1000)
+        # Merge PR, the merge box is loaded after the conversation tab
+        click_and_wait_for_url(self.conversation_tab, pr_url)
         expect(self.merge_button).to_be_enabled()
 
         self.merge_button.click()
-        self.page.wait_for_timeout(1000)
 
         expect(self.confirm_merge_button).to_be_enabled()
         self.confirm_merge_button.click()
@@ -1,5 +1,6 @@
 from playwright.sync_api import Page, expect
 import os
+from tests.GUI.waits import click_and_wait_for_url
 
 
 class PullRequestPage:
@@ -78,7 +79,6 @@ class PullRequestPage:
 
         # Commit changes
         self.commit_changes_button.click()
-        self.page.wait_for_timeout(500)
 
         # Fill PR details
         expect(self.description_input).to_be_visible()
@@ -86,8 +86,12 @@ class PullRequestPage:
         self.new_branch_radio.check()
 
         # Create PR
-        self.page.wait_for_timeout(500)
-        self.propose_changes_button.click()
-        self.page.wait_for_timeout(500)
-        self.create_pr_button.click()
-        self.page.wait_for_timeout(500) 
\ No newline at end of file
+        expect(self.propose_changes_button).to_be_enabled()
+        click_and_wait_for_url(
+            self.propose_changes_button,
+            f"**/{username}/{repo_name}/compare/**"
+        )
+        click_and_wait_for_url(
+            self.create_pr_button,
+            f"**/{username}/{repo_name}/pull/*"
+        )
\ No newline at end of file
@@ -1,4 +1,9 @@
 from playwright.sync_api import Page, expect
+import os
+from tests.GUI.waits import network_idle
+
+# Endpoint of the repository name availability check
+NAME_CHECK_URL = r"/repositories/check-name"
 
 
 class RepositoryPage:
@@ -12,11 +17,7 @@ class RepositoryPage:
             page (Page): Playwright page object
         """
         self.page = page
-        self.new_repo_link = page.get_by_role(
-            "link",
-            name="New",
-            exact=True
-        )
+        self.base_url = os.getenv("BASE_URL_GUI")
         self.repo_name_input = page.get_by_role(
             "textbox",
             name="Repository name *"
@@ -46,8 +47,11 @@ class RepositoryPage:
             name (str): Repository name
             description (str): Repository description
         """
-        self.new_repo_link.click()
-        self.repo_name_input.fill(name)
+        # Contexts start logged in on a blank page
+        self.page.goto(f"{self.base_url}/new")
+        # Wait for the debounced repository name availability check
+        with network_idle(self.page, NAME_CHECK_URL):
+            self.repo_name_input.fill(name)
         self.repo_description_input.fill(description)
         self.private_radio.check()
         self.readme_checkbox.check()
@@ -59,7 +63,6 @@ class RepositoryPage:
             state='visible',
             timeout=5000
         )
-        self.page.wait_for_timeout(500)
         self.create_repo_button.click(force=True, timeout=5000)
         
         expect(
@@ -3,61 +3,54 @@ import pytest
 import logging
 import allure
 from playwright.sync_api import Page
-from tests.GUI.pages.login_page import LoginPage
 from tests.GUI.pages.repository_page import RepositoryPage
 from tests.GUI.pages.pull_request_page import PullRequestPage
 from tests.GUI.pages.merge_page import MergePage
-from tests.api_helpers.github_helpers import (
-    delete_repository,
-    verify_repository_not_exists
-)
+from tests.api_helpers.preconditions import PreconditionBuilder
 
 USERNAME = os.getenv("GITHUB_USERNAME")
-PASSWORD = os.getenv("GITHUB_PASSWORD")
 BASE_URL_GUI = os.getenv("BASE_URL_GUI")
 REPO_NAME = "test-repo-playwright"
 TOKEN = os.getenv("GITHUB_API_KEY")
+HEADERS = {"Authorization": f"token {TOKEN}"}
+PR_CONTENT = "TestAutomationCode"
+PR_DESCRIPTION = "TestAutomationDescription"
 
 @pytest.fixture(autouse=True)
-def login(page: Page):
-    login_page = LoginPage(page)
-    login_page.login(USERNAME, PASSWORD)
+def require_token():
+    if TOKEN is None:
+        pytest.skip("GITHUB_TOKEN is not set")
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_and_cleanup(worker_id):
+@pytest.fixture
+def new_repo_name(worker_id):
     """
-    Setup and cleanup fixture for repository management.
-    Handles parallel test execution with unique repository names.
+    Name of a repository that does not exist yet, unique per worker for
+    parallel runs. The repository is deleted again after the test.
     """
-    headers = {"Authorization": f"token {TOKEN}"}
-    
-    if TOKEN is None:
-        pytest.skip("GITHUB_TOKEN is not set")
-    
-    # Add unique identifier for parallel runs
-    parallel_repo_name = f"{REPO_NAME}-{worker_id}" if worker_id != "master" else REPO_NAME
-        
-    def cleanup_repository():
-        try:
-            if not verify_repository_not_exists(headers, USERNAME, parallel_repo_name):
-                delete_repository(headers, USERNAME, parallel_repo_name)
-                assert verify_repository_not_exists(headers, USERNAME, parallel_repo_name), "Failed to delete repository"
-        except Exception as e:
-            pytest.fail(f"Error during repository cleanup: {str(e)}")
-    
-    # Run cleanup at the start
-    cleanup_repository()
-    
-    yield parallel_repo_name  # Pass the repo name to tests
-    
-    # Run cleanup after tests
-    cleanup_repository()
+    repo_name = f"{REPO_NAME}-{worker_id}" if worker_id != "master" else REPO_NAME
+    builder = PreconditionBuilder(HEADERS, USERNAME, repo_name).without_repository()
+    yield repo_name
+    builder.without_repository()
 
-@pytest.fixture(autouse=True)
-def update_repo_name(setup_and_cleanup):
-    """Update global REPO_NAME for each test."""
-    global REPO_NAME
-    REPO_NAME = setup_and_cleanup
+@pytest.fixture
+def pooled_repo_name(repo_pool):
+    """Name of a pooled repository with a README, reset after the test."""
+    with repo_pool.leased() as repository:
+        yield repository.name
+
+@pytest.fixture
+def open_pull_request(pooled_repo_name):
+    """
+    Pooled repository with an open pull request replacing README.md,
+    prepared through the API.
+    """
+    return (
+        PreconditionBuilder(HEADERS, USERNAME, pooled_repo_name)
+        .with_repository()
+        .with_readme_change("update-readme", PR_CONTENT)
+        .with_pull_request(body=PR_DESCRIPTION)
+        .build()
+    )
 
 @allure.epic("GitHub GUI Operations")
 @allure.feature("Repository Management")
@@ -65,37 +58,37 @@ class TestGitHubOperations:
     
     @allure.story("Repository Creation")
     @allure.title("Test repository creation via GUI")
-    def test_create_repository(self, page: Page):
+    def test_create_repository(self, page: Page, new_repo_name):
         """Test repository creation functionality."""
         with allure.step("Create new repository"):
             repo_page = RepositoryPage(page)
             repo_page.create_repository(
-                name=REPO_NAME,
+                name=new_repo_name,
                 description="Test repository created by Playwright"
             )
 
     @allure.story("Pull Request Creation")
     @allure.title("Test pull request creation via GUI")
-    def test_create_pull_request(self, page: Page):
+    def test_create_pull_request(self, page: Page, pooled_repo_name):
         """Test pull request creation functionality."""
         with allure.step("Create new pull request"):
             pr_page = PullRequestPage(page)
             pr_page.create_pull_request(
                 username=USERNAME,
-                repo_name=REPO_NAME, 
-                content="TestAutomationCode",
-                pr_description="TestAutomationDescription"
+                repo_name=pooled_repo_name,
+                content=PR_CONTENT,
+                pr_description=PR_DESCRIPTION
             )
 
     @allure.story("Pull Request Merge")
     @allure.title("Test pull request merge via GUI")
-    def test_merge_pull_request(self, page: Page):
+    def test_merge_pull_request(self, page: Page, open_pull_request):
         """Test pull request merge functionality."""
         with allure.step("Merge pull request"):
             merge_page = MergePage(page)
             merge_page.validate_and_merge_pr(
                 username=USERNAME,
-                repo_name=REPO_NAME,
-                content="TestAutomationCode",
-                pr_description="TestAutomationDescription"
+                repo_name=open_pull_request.repo_name,
+                content=PR_CONTENT,
+                pr_description=PR_DESCRIPTION
             ) 
\ No newline at end of file
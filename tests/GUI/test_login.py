@@ -11,6 +11,7 @@ PASSWORD = os.getenv("GITHUB_PASSWORD")
 @allure.feature("Authentication")
 @allure.story("Login")
 @allure.title("Test GitHub login functionality")
+@pytest.mark.browser_context_args(storage_state=None)
 def test_smoke_login(page: Page):
     """
     Smoke test verifying basic GitHub login functionality.
@@ -0,0 +1,161 @@
+import ast
+import contextlib
+import os
+import re
+import time
+from pathlib import Path
+from typing import Iterator, List, Pattern, Union
+
+from playwright.sync_api import Locator, Page, Request
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# Maximum time to wait for a condition in milliseconds
+WAIT_TIMEOUT = float(os.getenv("GUI_WAIT_TIMEOUT", "10000"))
+
+# Time without matching requests after which the network counts as idle
+QUIET_PERIOD = float(os.getenv("GUI_QUIET_PERIOD", "250"))
+
+# Interval at which pending requests are polled
+POLL_INTERVAL = 50
+
+# Fail the session when page objects still contain fixed sleeps
+STRICT_WAITS = os.getenv("STRICT_WAITS", "false").lower() == "true"
+
+# Calls that pause for a fixed time instead of waiting for a condition
+FIXED_SLEEPS = {"wait_for_timeout", "sleep"}
+
+# Page objects checked in strict mode
+PAGES_DIR = Path(__file__).parent / "pages"
+
+
+class RequestTracker:
+    """Counts in-flight XHR/fetch requests of a page matching a URL pattern."""
+
+    def __init__(self, page: Page, url_pattern: Union[str, Pattern[str]] = ""):
+        """
+        Initialize RequestTracker.
+
+        Args:
+            page (Page): Playwright page object
+            url_pattern (Union[str, Pattern[str]]): Regular expression searched
+                in request URLs (default: all requests)
+        """
+        self.page = page
+        self.url_pattern = re.compile(url_pattern)
+        self.pending: List[Request] = []
+        self.last_activity = time.monotonic()
+
+    def _matches(self, request: Request) -> bool:
+        return (
+            request.resource_type in ("xhr", "fetch")
+            and self.url_pattern.search(request.url) is not None
+        )
+
+    def _on_request(self, request: Request) -> None:
+        if self._matches(request):
+            self.pending.append(request)
+            self.last_activity = time.monotonic()
+
+    def _on_done(self, request: Request) -> None:
+        if request in self.pending:
+            self.pending.remove(request)
+            self.last_activity = time.monotonic()
+
+    def start(self) -> "RequestTracker":
+        self.page.on("request", self._on_request)
+        self.page.on("requestfinished", self._on_done)
+        self.page.on("requestfailed", self._on_done)
+        return self
+
+    def stop(self) -> None:
+        self.page.remove_listener("request", self._on_request)
+        self.page.remove_listener("requestfinished", self._on_done)
+        self.page.remove_listener("requestfailed", self._on_done)
+
+    def wait_for_idle(self, timeout: float = WAIT_TIMEOUT, quiet: float = QUIET_PERIOD) -> None:
+        """
+        Waits until no matching request is pending and none started for the
+        quiet period, which also covers requests fired after a debounce.
+
+        Args:
+            timeout (float): Maximum wait in milliseconds
+            quiet (float): Required time without matching requests in milliseconds
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while self.pending or time.monotonic() - self.last_activity < quiet / 1000:
+            if time.monotonic() >= deadline:
+                urls = ", ".join(request.url for request in self.pending)
+                raise PlaywrightTimeoutError(
+                    f"Network not idle after {timeout:.0f}ms, pending: {urls or 'none'}"
+                )
+            # Polling through Playwright keeps request events dispatched
+            self.page.wait_for_timeout(POLL_INTERVAL)
+
+
+@contextlib.contextmanager
+def network_idle(
+    page: Page,
+    url_pattern: Union[str, Pattern[str]] = "",
+    timeout: float = WAIT_TIMEOUT,
+    quiet: float = QUIET_PERIOD
+) -> Iterator[RequestTracker]:
+    """
+    Waits after the with block until the XHR/fetch requests it triggered settled.
+
+    Args:
+        page (Page): Playwright page object
+        url_pattern (Union[str, Pattern[str]]): Regular expression searched
+            in request URLs (default: all requests)
+        timeout (float): Maximum wait in milliseconds
+        quiet (float): Required time without matching requests in milliseconds
+
+    Yields:
+        RequestTracker: Tracker of the requests
+    """
+    tracker = RequestTracker(page, url_pattern).start()
+    try:
+        yield tracker
+        tracker.wait_for_idle(timeout, quiet)
+    finally:
+        tracker.stop()
+
+
+def click_and_wait_for_url(
+    locator: Locator,
+    url: Union[str, Pattern[str]],
+    timeout: float = WAIT_TIMEOUT
+) -> None:
+    """
+    Clicks an element and waits until the page URL matches, which also
+    covers client-side navigations that never fire a load event.
+
+    Args:
+        locator (Locator): Element to click
+        url (Union[str, Pattern[str]]): Glob pattern or regular expression
+        timeout (float): Maximum wait in milliseconds
+    """
+    locator.click(timeout=timeout)
+    locator.page.wait_for_url(url, wait_until="commit", timeout=timeout)
+
+
+def find_fixed_sleeps(directory: Path = PAGES_DIR) -> List[str]:
+    """
+    Lists fixed sleeps (page.wait_for_timeout, time.sleep) in Python files.
+
+    Args:
+        directory (Path): Directory searched recursively
+
+    Returns:
+        List[str]: Findings as path:line: call
+    """
+    findings = []
+    for path in sorted(Path(directory).rglob("*.py")):
+        tree = ast.parse(path.read_text(), filename=str(path))
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr in FIXED_SLEEPS
+            ):
+                findings.append(f"{path}:{node.lineno}: {ast.unparse(node)}")
+    return findings
@@ -0,0 +1,394 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+
+from tests.api_helpers.github_client import GitHubClient
+
+# Default number of GitHub requests allowed in flight at the same time
+DEFAULT_CONCURRENCY = 10
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable],
+    limit: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Awaits all awaitables with at most `limit` of them running at once.
+    Only coroutines are bounded: tasks and futures, e.g. from
+    run_in_executor, are already running when they are passed in.
+
+    Args:
+        awaitables (Iterable[Awaitable]): Coroutines to run
+        limit (int): Maximum number of concurrently running coroutines
+        return_exceptions (bool): Return raised exceptions as results
+            instead of propagating the first one
+
+    Returns:
+        List[Any]: Results in the order of the given awaitables
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(awaitable: Awaitable) -> Any:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(
+        *(bounded(awaitable) for awaitable in awaitables),
+        return_exceptions=return_exceptions
+    )
+
+
+def run_sync(coroutine: Awaitable) -> Any:
+    """
+    Runs a coroutine to completion from synchronous code, e.g. pytest fixtures.
+
+    Args:
+        coroutine (Awaitable): Coroutine to run
+
+    Returns:
+        Any: Coroutine result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # Called from inside a running loop, so run on a separate thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def fan_out(
+    func: Callable,
+    items: Iterable,
+    limit: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Calls a blocking function for every item concurrently from synchronous code.
+
+    Args:
+        func (Callable): Function called with a single item
+        items (Iterable): Items to process
+        limit (int): Maximum number of concurrent calls
+        return_exceptions (bool): Return raised exceptions as results
+
+    Returns:
+        List[Any]: Results in the order of the given items
+    """
+    items = list(items)
+
+    async def run_all() -> List[Any]:
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=limit) as executor:
+
+            async def call(item: Any) -> Any:
+                # Submitted only once the semaphore of gather_bounded is held
+                return await loop.run_in_executor(executor, func, item)
+
+            return await gather_bounded(
+                (call(item) for item in items),
+                limit,
+                return_exceptions
+            )
+
+    return run_sync(run_all())
+
+
+class AsyncGitHubClient:
+    """Asyncio counterpart of GitHubClient for concurrent GitHub operations."""
+
+    def __init__(
+        self,
+        headers: dict = None,
+        base_url: str = None,
+        concurrency: int = DEFAULT_CONCURRENCY
+    ):
+        """
+        Initialize AsyncGitHubClient.
+
+        Args:
+            headers (dict): Headers containing GitHub authorization token
+            base_url (str): GitHub API base URL
+            concurrency (int): Maximum number of requests in flight
+        """
+        self.concurrency = concurrency
+        self.client = GitHubClient(
+            headers=headers,
+            base_url=base_url,
+            pool_size=concurrency
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="github-async"
+        )
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # close() waits for worker threads, which must not block the loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """Stops worker threads and closes pooled connections."""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    async def _call(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def create_new_repository(
+        self,
+        repo_name: str = "TestRepository",
+        description: str = "Test repository description"
+    ) -> str:
+        """
+        Creates a new GitHub repository
+
+        Args:
+            repo_name (str): Name of the repository to create
+            description (str): Repository description
+
+        Returns:
+            str: Name of the created repository
+        """
+        return await self._call(
+            self.client.create_new_repository, repo_name, description
+        )
+
+    async def create_new_branch(
+        self,
+        username: str,
+        repo_name: str,
+        branch_name: str,
+        base_branch: str = "main"
+    ) -> dict:
+        """
+        Creates a new branch in the specified repository.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the new branch
+            base_branch (str): Name of the base branch (default: main)
+
+        Returns:
+            dict: Branch creation response data
+        """
+        return await self._call(
+            self.client.create_new_branch,
+            username,
+            repo_name,
+            branch_name,
+            base_branch
+        )
+
+    async def push_commit_to_branch(
+        self,
+        username: str,
+        repo_name: str,
+        branch_name: str,
+        file_content: str,
+        commit_message: str,
+        file_path: str
+    ) -> dict:
+        """
+        Pushes a commit to the specified branch.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the branch
+            file_content (str): Content to commit
+            commit_message (str): Commit message
+            file_path (str): Path to the file in repository
+
+        Returns:
+            dict: Commit response data
+        """
+        return await self._call(
+            self.client.push_commit_to_branch,
+            username,
+            repo_name,
+            branch_name,
+            file_content,
+            commit_message,
+            file_path
+        )
+
+    async def commit_files(
+        self,
+        username: str,
+        repo_name: str,
+        branch_name: str,
+        files: Dict[str, str],
+        commit_message: str
+    ) -> dict:
+        """
+        Commits several files to the specified branch as a single commit.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the branch
+            files (Dict[str, str]): File contents keyed by path in repository
+            commit_message (str): Commit message
+
+        Returns:
+            dict: Commit response data
+        """
+        return await self._call(
+            self.client.commit_files,
+            username,
+            repo_name,
+            branch_name,
+            files,
+            commit_message
+        )
+
+    async def create_pull_request(
+        self,
+        username: str,
+        repo_name: str,
+        head_branch: str,
+        base_branch: str = "main",
+        title: str = None,
+        body: str = None
+    ) -> dict:
+        """
+        Creates a new pull request.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            head_branch (str): Name of the branch containing changes
+            base_branch (str): Name of the target branch (default: main)
+            title (str): Title of the pull request
+            body (str): Description of the pull request
+
+        Returns:
+            dict: Pull request data
+        """
+        return await self._call(
+            self.client.create_pull_request,
+            username,
+            repo_name,
+            head_branch,
+            base_branch,
+            title,
+            body
+        )
+
+    async def delete_repository(self, username: str, repo_name: str) -> None:
+        """
+        Deletes a repository.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository to delete
+        """
+        await self._call(self.client.delete_repository, username, repo_name)
+
+    async def verify_repository_not_exists(
+        self,
+        username: str,
+        repo_name: str
+    ) -> bool:
+        """
+        Verifies that a repository does not exist.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository to check
+
+        Returns:
+            bool: True if repository does not exist
+        """
+        return await self._call(
+            self.client.verify_repository_not_exists, username, repo_name
+        )
+
+    async def create_repositories(
+        self,
+        repo_names: Iterable[str],
+        description: str = "Test repository description"
+    ) -> List[str]:
+        """
+        Creates several repositories concurrently.
+
+        Args:
+            repo_names (Iterable[str]): Names of the repositories to create
+            description (str): Repository description
+
+        Returns:
+            List[str]: Names of the created repositories
+        """
+        return await gather_bounded(
+            (self.create_new_repository(name, description) for name in repo_names),
+            self.concurrency
+        )
+
+    async def create_branches(
+        self,
+        username: str,
+        repo_name: str,
+        branch_names: Iterable[str],
+        base_branch: str = "main"
+    ) -> List[dict]:
+        """
+        Creates several branches of one repository concurrently.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_names (Iterable[str]): Names of the new branches
+            base_branch (str): Name of the base branch (default: main)
+
+        Returns:
+            List[dict]: Branch creation response data
+        """
+        return await gather_bounded(
+            (
+                self.create_new_branch(username, repo_name, name, base_branch)
+                for name in branch_names
+            ),
+            self.concurrency
+        )
+
+    async def delete_repositories(
+        self,
+        username: str,
+        repo_names: Iterable[str]
+    ) -> List[str]:
+        """
+        Deletes several repositories concurrently. Every deletion is attempted
+        even if some of them fail.
+
+        Args:
+            username (str): GitHub username
+            repo_names (Iterable[str]): Names of the repositories to delete
+
+        Returns:
+            List[str]: Names of the repositories that were deleted
+        """
+        repo_names = list(repo_names)
+        results = await gather_bounded(
+            (self.delete_repository(username, name) for name in repo_names),
+            self.concurrency,
+            return_exceptions=True
+        )
+        deleted = []
+        for name, result in zip(repo_names, results):
+            if isinstance(result, Exception):
+                logging.error(f"Failed to delete repository {name}: {result}")
+            else:
+                deleted.append(name)
+        return deleted
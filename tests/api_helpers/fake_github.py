@@ -0,0 +1,743 @@
+import argparse
+import base64
+import hashlib
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+# Value of BASE_URL selecting an in-process fake instead of api.github.com
+FAKE_BASE_URL = "fake"
+
+# Environment variable passing the address of a running fake to xdist workers
+FAKE_URL_ENV = "FAKE_GITHUB_URL"
+
+DEFAULT_PER_PAGE = 30
+MAX_PER_PAGE = 100
+
+
+class ApiError(Exception):
+    """Error rendered as a GitHub style JSON error response."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _git_sha(kind: str, data: bytes) -> str:
+    return hashlib.sha1(f"{kind} {len(data)}\0".encode() + data).hexdigest()
+
+
+class FakeRepository:
+    """In-memory state of a single repository."""
+
+    def __init__(self, owner: str, name: str, description: str, private: bool):
+        self.owner = owner
+        self.name = name
+        self.description = description
+        self.private = private
+        self.default_branch = "main"
+        self.created_at = _timestamp()
+        self.updated_at = self.created_at
+        self.blobs: Dict[str, bytes] = {}
+        self.trees: Dict[str, Dict[str, dict]] = {}
+        self.commits: Dict[str, dict] = {}
+        self.refs: Dict[str, str] = {}
+        self.tags: Dict[str, str] = {}
+        self.pulls: List[dict] = []
+        self._commit_counter = itertools.count()
+
+    def create_blob(self, content: bytes) -> str:
+        sha = _git_sha("blob", content)
+        self.blobs[sha] = content
+        return sha
+
+    def create_tree(self, entries: Dict[str, dict]) -> str:
+        """Stores a tree as a flat mapping of file path to blob entry."""
+        data = json.dumps(sorted(entries.items())).encode()
+        sha = _git_sha("tree", data)
+        self.trees[sha] = dict(entries)
+        return sha
+
+    def create_commit(self, message: str, tree: str, parents: List[str]) -> dict:
+        now = _timestamp()
+        author = {"name": self.owner, "email": f"{self.owner}@users.noreply.github.com", "date": now}
+        data = json.dumps([message, tree, parents, next(self._commit_counter), time.time()]).encode()
+        sha = _git_sha("commit", data)
+        self.commits[sha] = {
+            "sha": sha,
+            "message": message,
+            "tree": tree,
+            "parents": list(parents),
+            "author": author,
+            "committer": author
+        }
+        self.updated_at = now
+        return self.commits[sha]
+
+    def commit_json(self, sha: str, base_url: str) -> dict:
+        commit = self.commits[sha]
+        return {
+            "sha": sha,
+            "url": f"{base_url}/repos/{self.owner}/{self.name}/git/commits/{sha}",
+            "message": commit["message"],
+            "author": commit["author"],
+            "committer": commit["committer"],
+            "tree": {"sha": commit["tree"]},
+            "parents": [{"sha": parent} for parent in commit["parents"]]
+        }
+
+    def is_ancestor(self, ancestor: str, sha: str) -> bool:
+        pending = [sha]
+        seen = set()
+        while pending:
+            current = pending.pop()
+            if current == ancestor:
+                return True
+            if current in seen or current not in self.commits:
+                continue
+            seen.add(current)
+            pending.extend(self.commits[current]["parents"])
+        return False
+
+    def tree_of(self, branch: str) -> Dict[str, dict]:
+        return self.trees[self.commits[self.refs[branch]]["tree"]]
+
+
+class FakeGitHub:
+    """In-memory implementation of the GitHub REST endpoints used by the helpers."""
+
+    def __init__(self, username: str):
+        """
+        Initialize FakeGitHub.
+
+        Args:
+            username (str): Login of the authenticated user
+        """
+        self.username = username
+        self.base_url = ""
+        self.repos: Dict[Tuple[str, str], FakeRepository] = {}
+        self.lock = threading.RLock()
+        self.routes: List[Tuple[str, re.Pattern, Callable]] = []
+        self._route("GET", r"/users/(?P<user>[^/]+)", self.get_user)
+        self._route("GET", r"/user", self.get_authenticated_user)
+        self._route("GET", r"/user/repos", self.list_own_repos)
+        self._route("POST", r"/user/repos", self.create_repo)
+        self._route("GET", r"/users/(?P<user>[^/]+)/repos", self.list_user_repos)
+        repo = r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)"
+        self._route("GET", repo, self.get_repo)
+        self._route("DELETE", repo, self.delete_repo)
+        self._route("GET", repo + r"/branches", self.list_branches)
+        self._route("GET", repo + r"/branches/(?P<branch>.+)", self.get_branch)
+        self._route("GET", repo + r"/git/refs/heads/(?P<branch>.+)", self.get_ref)
+        self._route("GET", repo + r"/git/refs/tags/(?P<tag>.+)", self.get_tag_ref)
+        self._route("POST", repo + r"/git/refs", self.create_ref)
+        self._route("PATCH", repo + r"/git/refs/heads/(?P<branch>.+)", self.update_ref)
+        self._route("DELETE", repo + r"/git/refs/heads/(?P<branch>.+)", self.delete_ref)
+        self._route("GET", repo + r"/git/commits/(?P<sha>[0-9a-f]+)", self.get_commit)
+        self._route("POST", repo + r"/git/commits", self.create_commit)
+        self._route("GET", repo + r"/git/blobs/(?P<sha>[0-9a-f]+)", self.get_blob)
+        self._route("POST", repo + r"/git/blobs", self.create_blob)
+        self._route("GET", repo + r"/git/trees/(?P<sha>[0-9a-f]+)", self.get_tree)
+        self._route("POST", repo + r"/git/trees", self.create_tree)
+        self._route("GET", repo + r"/contents/(?P<path>.+)", self.get_contents)
+        self._route("PUT", repo + r"/contents/(?P<path>.+)", self.put_contents)
+        self._route("GET", repo + r"/pulls", self.list_pulls)
+        self._route("POST", repo + r"/pulls", self.create_pull)
+        self._route("GET", repo + r"/pulls/(?P<number>\d+)", self.get_pull)
+        self._route("PATCH", repo + r"/pulls/(?P<number>\d+)", self.update_pull)
+        self._route("GET", repo + r"/pulls/(?P<number>\d+)/files", self.list_pull_files)
+
+    def _route(self, method: str, pattern: str, handler: Callable) -> None:
+        self.routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    def dispatch(self, method: str, path: str, query: dict, body: dict) -> Tuple[int, object, dict]:
+        """
+        Handles a single API request.
+
+        Args:
+            method (str): HTTP method
+            path (str): Request path without query string
+            query (dict): Parsed query string
+            body (dict): Parsed JSON body
+
+        Returns:
+            Tuple[int, object, dict]: Status code, JSON payload and extra headers
+        """
+        path_matched = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            path_matched = True
+            if route_method != method:
+                continue
+            with self.lock:
+                result = handler(query=query, body=body, **match.groupdict())
+            if len(result) == 2:
+                return result[0], result[1], {}
+            return result
+        if path_matched:
+            raise ApiError(405, "Method Not Allowed")
+        raise ApiError(404, "Not Found")
+
+    # Users
+
+    def _user_json(self, login: str) -> dict:
+        return {
+            "login": login,
+            "id": int(hashlib.sha1(login.encode()).hexdigest()[:8], 16),
+            "type": "User",
+            "url": f"{self.base_url}/users/{login}",
+            "html_url": f"https://github.com/{login}",
+            "repos_url": f"{self.base_url}/users/{login}/repos"
+        }
+
+    def get_user(self, user: str, **_) -> Tuple[int, dict]:
+        return 200, self._user_json(user)
+
+    def get_authenticated_user(self, **_) -> Tuple[int, dict]:
+        return 200, self._user_json(self.username)
+
+    # Repositories
+
+    def _repo(self, owner: str, repo: str) -> FakeRepository:
+        repository = self.repos.get((owner, repo))
+        if repository is None:
+            raise ApiError(404, "Not Found")
+        return repository
+
+    def _repo_json(self, repository: FakeRepository) -> dict:
+        full_name = f"{repository.owner}/{repository.name}"
+        return {
+            "id": int(hashlib.sha1(full_name.encode()).hexdigest()[:8], 16),
+            "name": repository.name,
+            "full_name": full_name,
+            "owner": self._user_json(repository.owner),
+            "private": repository.private,
+            "description": repository.description,
+            "default_branch": repository.default_branch,
+            "created_at": repository.created_at,
+            "updated_at": repository.updated_at,
+            "pushed_at": repository.updated_at,
+            "url": f"{self.base_url}/repos/{full_name}",
+            "html_url": f"https://github.com/{full_name}",
+            "clone_url": f"https://github.com/{full_name}.git"
+        }
+
+    def _paginate(self, path: str, query: dict, items: list) -> Tuple[int, list, dict]:
+        per_page = min(int(query.get("per_page", DEFAULT_PER_PAGE)), MAX_PER_PAGE)
+        page = max(int(query.get("page", 1)), 1)
+        last_page = max(1, -(-len(items) // per_page))
+        headers = {}
+        links = []
+        for rel, number in (("next", page + 1), ("last", last_page)):
+            if page < last_page:
+                link_query = urlencode({**query, "per_page": per_page, "page": number})
+                links.append(f'<{self.base_url}{path}?{link_query}>; rel="{rel}"')
+        if links:
+            headers["Link"] = ", ".join(links)
+        return 200, items[(page - 1) * per_page:page * per_page], headers
+
+    def list_own_repos(self, query: dict, **_) -> Tuple[int, list, dict]:
+        return self.list_user_repos(user=self.username, query=query, path="/user/repos")
+
+    def list_user_repos(self, user: str, query: dict, path: str = None, **_) -> Tuple[int, list, dict]:
+        repositories = [
+            self._repo_json(repository)
+            for (owner, _name), repository in sorted(self.repos.items())
+            if owner == user
+        ]
+        return self._paginate(path or f"/users/{user}/repos", query, repositories)
+
+    def create_repo(self, body: dict, **_) -> Tuple[int, dict]:
+        name = body.get("name")
+        if not name:
+            raise ApiError(422, "Validation Failed: name is required")
+        if (self.username, name) in self.repos:
+            raise ApiError(422, "Repository creation failed: name already exists on this account")
+        repository = FakeRepository(
+            self.username,
+            name,
+            body.get("description"),
+            bool(body.get("private", False))
+        )
+        if body.get("auto_init"):
+            readme = f"# {name}\n"
+            if repository.description:
+                readme += f"{repository.description}\n"
+            blob = repository.create_blob(readme.encode())
+            tree = repository.create_tree({"README.md": {"mode": "100644", "type": "blob", "sha": blob}})
+            commit = repository.create_commit("Initial commit", tree, [])
+            repository.refs[repository.default_branch] = commit["sha"]
+        self.repos[(self.username, name)] = repository
+        return 201, self._repo_json(repository)
+
+    def get_repo(self, owner: str, repo: str, **_) -> Tuple[int, dict]:
+        return 200, self._repo_json(self._repo(owner, repo))
+
+    def delete_repo(self, owner: str, repo: str, **_) -> Tuple[int, None]:
+        self._repo(owner, repo)
+        del self.repos[(owner, repo)]
+        return 204, None
+
+    # Git data
+
+    def _ref_json(self, repository: FakeRepository, branch: str) -> dict:
+        sha = repository.refs[branch]
+        return {
+            "ref": f"refs/heads/{branch}",
+            "url": f"{self.base_url}/repos/{repository.owner}/{repository.name}/git/refs/heads/{branch}",
+            "object": {"sha": sha, "type": "commit"}
+        }
+
+    def _branch(self, repository: FakeRepository, branch: str) -> str:
+        if branch not in repository.refs:
+            raise ApiError(404, "Not Found")
+        return repository.refs[branch]
+
+    def list_branches(self, owner: str, repo: str, query: dict, **_) -> Tuple[int, list, dict]:
+        repository = self._repo(owner, repo)
+        branches = [
+            {"name": branch, "commit": {"sha": sha}, "protected": False}
+            for branch, sha in sorted(repository.refs.items())
+        ]
+        return self._paginate(f"/repos/{owner}/{repo}/branches", query, branches)
+
+    def get_branch(self, owner: str, repo: str, branch: str, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        sha = self._branch(repository, branch)
+        return 200, {
+            "name": branch,
+            "commit": {
+                "sha": sha,
+                "commit": repository.commit_json(sha, self.base_url)
+            },
+            "protected": False
+        }
+
+    def get_ref(self, owner: str, repo: str, branch: str, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        self._branch(repository, branch)
+        return 200, self._ref_json(repository, branch)
+
+    def _tag_ref_json(self, repository: FakeRepository, tag: str) -> dict:
+        return {
+            "ref": f"refs/tags/{tag}",
+            "url": f"{self.base_url}/repos/{repository.owner}/{repository.name}/git/refs/tags/{tag}",
+            "object": {"sha": repository.tags[tag], "type": "commit"}
+        }
+
+    def get_tag_ref(self, owner: str, repo: str, tag: str, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        if tag not in repository.tags:
+            raise ApiError(404, "Not Found")
+        return 200, self._tag_ref_json(repository, tag)
+
+    def create_ref(self, owner: str, repo: str, body: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        ref = body.get("ref", "")
+        sha = body.get("sha")
+        if not ref.startswith(("refs/heads/", "refs/tags/")) or ref.count("/") < 2:
+            raise ApiError(422, "Reference name is invalid")
+        if sha not in repository.commits:
+            raise ApiError(422, "Object does not exist")
+        if ref.startswith("refs/tags/"):
+            tag = ref[len("refs/tags/"):]
+            if tag in repository.tags:
+                raise ApiError(422, "Reference already exists")
+            repository.tags[tag] = sha
+            return 201, self._tag_ref_json(repository, tag)
+        branch = ref[len("refs/heads/"):]
+        if branch in repository.refs:
+            raise ApiError(422, "Reference already exists")
+        repository.refs[branch] = sha
+        return 201, self._ref_json(repository, branch)
+
+    def update_ref(self, owner: str, repo: str, branch: str, body: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        current = self._branch(repository, branch)
+        sha = body.get("sha")
+        if sha not in repository.commits:
+            raise ApiError(422, "Object does not exist")
+        if not body.get("force") and not repository.is_ancestor(current, sha):
+            raise ApiError(422, "Update is not a fast forward")
+        repository.refs[branch] = sha
+        return 200, self._ref_json(repository, branch)
+
+    def delete_ref(self, owner: str, repo: str, branch: str, **_) -> Tuple[int, None]:
+        repository = self._repo(owner, repo)
+        self._branch(repository, branch)
+        if branch == repository.default_branch:
+            raise ApiError(422, "Cannot delete the default branch")
+        del repository.refs[branch]
+        return 204, None
+
+    def get_commit(self, owner: str, repo: str, sha: str, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        if sha not in repository.commits:
+            raise ApiError(404, "Not Found")
+        return 200, repository.commit_json(sha, self.base_url)
+
+    def create_commit(self, owner: str, repo: str, body: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        tree = body.get("tree")
+        parents = body.get("parents", [])
+        if tree not in repository.trees or any(p not in repository.commits for p in parents):
+            raise ApiError(422, "Tree or parent SHA does not exist")
+        commit = repository.create_commit(body.get("message", ""), tree, parents)
+        return 201, repository.commit_json(commit["sha"], self.base_url)
+
+    def get_blob(self, owner: str, repo: str, sha: str, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        if sha not in repository.blobs:
+            raise ApiError(404, "Not Found")
+        content = repository.blobs[sha]
+        return 200, {
+            "sha": sha,
+            "size": len(content),
+            "encoding": "base64",
+            "content": base64.b64encode(content).decode("ascii")
+        }
+
+    def create_blob(self, owner: str, repo: str, body: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        if "content" not in body:
+            raise ApiError(422, "Invalid request: content is required")
+        if body.get("encoding") == "base64":
+            content = base64.b64decode(body["content"])
+        else:
+            content = body["content"].encode("utf-8")
+        sha = repository.create_blob(content)
+        return 201, {
+            "sha": sha,
+            "url": f"{self.base_url}/repos/{owner}/{repo}/git/blobs/{sha}"
+        }
+
+    def _tree_json(self, repository: FakeRepository, sha: str) -> dict:
+        return {
+            "sha": sha,
+            "url": f"{self.base_url}/repos/{repository.owner}/{repository.name}/git/trees/{sha}",
+            "tree": [
+                {"path": path, **entry}
+                for path, entry in sorted(repository.trees[sha].items())
+            ],
+            "truncated": False
+        }
+
+    def get_tree(self, owner: str, repo: str, sha: str, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        if sha not in repository.trees:
+            raise ApiError(404, "Not Found")
+        return 200, self._tree_json(repository, sha)
+
+    def create_tree(self, owner: str, repo: str, body: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        base_tree = body.get("base_tree")
+        if base_tree is not None and base_tree not in repository.trees:
+            raise ApiError(422, "base_tree does not exist")
+        entries = dict(repository.trees.get(base_tree, {}))
+        for item in body.get("tree", []):
+            path = item.get("path")
+            if not path:
+                raise ApiError(422, "Invalid tree entry: path is required")
+            if "content" in item:
+                sha = repository.create_blob(item["content"].encode("utf-8"))
+            else:
+                sha = item.get("sha")
+            if sha is None:
+                entries.pop(path, None)
+                continue
+            if sha not in repository.blobs:
+                raise ApiError(422, f"Invalid tree entry: blob {sha} does not exist")
+            entries[path] = {"mode": item.get("mode", "100644"), "type": "blob", "sha": sha}
+        return 201, self._tree_json(repository, repository.create_tree(entries))
+
+    # Contents
+
+    def _contents_json(self, repository: FakeRepository, path: str, sha: str) -> dict:
+        content = repository.blobs[sha]
+        return {
+            "type": "file",
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "sha": sha,
+            "size": len(content),
+            "encoding": "base64",
+            "content": base64.b64encode(content).decode("ascii")
+        }
+
+    def get_contents(self, owner: str, repo: str, path: str, query: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        branch = query.get("ref", repository.default_branch)
+        if branch not in repository.refs:
+            raise ApiError(404, f"No commit found for the ref {branch}")
+        entry = repository.tree_of(branch).get(path)
+        if entry is None:
+            raise ApiError(404, "Not Found")
+        return 200, self._contents_json(repository, path, entry["sha"])
+
+    def put_contents(self, owner: str, repo: str, path: str, body: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        if "message" not in body or "content" not in body:
+            raise ApiError(422, "Invalid request: message and content are required")
+        branch = body.get("branch", repository.default_branch)
+        parent = repository.refs.get(branch)
+        if parent is None and repository.refs:
+            raise ApiError(404, f"Branch {branch} not found")
+        entries = dict(repository.tree_of(branch)) if parent else {}
+
+        existing = entries.get(path)
+        if existing is not None and body.get("sha") is None:
+            raise ApiError(422, "Invalid request: \"sha\" wasn't supplied.")
+        if existing is not None and body["sha"] != existing["sha"]:
+            raise ApiError(409, f"{path} does not match {body['sha']}")
+
+        blob = repository.create_blob(base64.b64decode(body["content"]))
+        entries[path] = {"mode": "100644", "type": "blob", "sha": blob}
+        tree = repository.create_tree(entries)
+        commit = repository.create_commit(body["message"], tree, [parent] if parent else [])
+        repository.refs[branch] = commit["sha"]
+        return 200 if existing else 201, {
+            "content": self._contents_json(repository, path, blob),
+            "commit": repository.commit_json(commit["sha"], self.base_url)
+        }
+
+    # Pull requests
+
+    def _pull(self, repository: FakeRepository, number: str) -> dict:
+        for pull in repository.pulls:
+            if pull["number"] == int(number):
+                return pull
+        raise ApiError(404, "Not Found")
+
+    def _pull_json(self, repository: FakeRepository, pull: dict) -> dict:
+        full_name = f"{repository.owner}/{repository.name}"
+        return {
+            "number": pull["number"],
+            "title": pull["title"],
+            "body": pull["body"],
+            "state": pull["state"],
+            "merged": False,
+            "user": self._user_json(self.username),
+            "head": {"ref": pull["head"], "sha": repository.refs.get(pull["head"])},
+            "base": {"ref": pull["base"], "sha": repository.refs.get(pull["base"])},
+            "created_at": pull["created_at"],
+            "updated_at": pull["updated_at"],
+            "url": f"{self.base_url}/repos/{full_name}/pulls/{pull['number']}",
+            "html_url": f"https://github.com/{full_name}/pull/{pull['number']}"
+        }
+
+    def list_pulls(self, owner: str, repo: str, query: dict, **_) -> Tuple[int, list, dict]:
+        repository = self._repo(owner, repo)
+        state = query.get("state", "open")
+        pulls = [
+            self._pull_json(repository, pull)
+            for pull in reversed(repository.pulls)
+            if state == "all" or pull["state"] == state
+        ]
+        return self._paginate(f"/repos/{owner}/{repo}/pulls", query, pulls)
+
+    def create_pull(self, owner: str, repo: str, body: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        head = body.get("head", "").split(":")[-1]
+        base = body.get("base", "")
+        if not body.get("title"):
+            raise ApiError(422, "Validation Failed: title is required")
+        if head not in repository.refs or base not in repository.refs:
+            raise ApiError(422, "Validation Failed: head or base branch does not exist")
+        if repository.is_ancestor(repository.refs[head], repository.refs[base]):
+            raise ApiError(422, f"No commits between {base} and {head}")
+        if any(
+            pull["state"] == "open" and pull["head"] == head and pull["base"] == base
+            for pull in repository.pulls
+        ):
+            raise ApiError(422, f"A pull request already exists for {owner}:{head}")
+        now = _timestamp()
+        pull = {
+            "number": len(repository.pulls) + 1,
+            "title": body["title"],
+            "body": body.get("body"),
+            "state": "open",
+            "head": head,
+            "base": base,
+            "created_at": now,
+            "updated_at": now
+        }
+        repository.pulls.append(pull)
+        return 201, self._pull_json(repository, pull)
+
+    def get_pull(self, owner: str, repo: str, number: str, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        return 200, self._pull_json(repository, self._pull(repository, number))
+
+    def update_pull(self, owner: str, repo: str, number: str, body: dict, **_) -> Tuple[int, dict]:
+        repository = self._repo(owner, repo)
+        pull = self._pull(repository, number)
+        for field in ("title", "body", "state"):
+            if field in body:
+                pull[field] = body[field]
+        pull["updated_at"] = _timestamp()
+        return 200, self._pull_json(repository, pull)
+
+    def list_pull_files(self, owner: str, repo: str, number: str, query: dict, **_) -> Tuple[int, list, dict]:
+        repository = self._repo(owner, repo)
+        pull = self._pull(repository, number)
+        base = repository.tree_of(pull["base"]) if pull["base"] in repository.refs else {}
+        head = repository.tree_of(pull["head"]) if pull["head"] in repository.refs else {}
+        files = []
+        for path in sorted(set(base) | set(head)):
+            old = base.get(path)
+            new = head.get(path)
+            if old == new:
+                continue
+            old_lines = repository.blobs[old["sha"]].decode("utf-8", "replace").splitlines() if old else []
+            new_lines = repository.blobs[new["sha"]].decode("utf-8", "replace").splitlines() if new else []
+            status = "added" if old is None else "removed" if new is None else "modified"
+            files.append({
+                "sha": (new or old)["sha"],
+                "filename": path,
+                "status": status,
+                "additions": len(new_lines),
+                "deletions": len(old_lines),
+                "changes": len(new_lines) + len(old_lines)
+            })
+        return self._paginate(f"/repos/{owner}/{repo}/pulls/{number}/files", query, files)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Small keep-alive responses would otherwise wait for the delayed ACK
+    disable_nagle_algorithm = True
+    server: "FakeGitHubServer"
+
+    def _handle(self) -> None:
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            if not self.headers.get("Authorization"):
+                raise ApiError(401, "Requires authentication")
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw_body) if raw_body else {}
+            except ValueError:
+                raise ApiError(400, "Problems parsing JSON")
+            status, payload, headers = self.server.github.dispatch(
+                self.command, url.path.rstrip("/") or "/", query, body
+            )
+        except ApiError as error:
+            status, payload, headers = error.status, {
+                "message": error.message,
+                "documentation_url": "https://docs.github.com/rest"
+            }, {}
+        self._respond(status, payload, headers)
+
+    def _respond(self, status: int, payload: object, headers: dict) -> None:
+        data = b"" if payload is None else json.dumps(payload).encode()
+        headers = {
+            **headers,
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "5000",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600)
+        }
+        if self.command == "GET" and status == 200:
+            etag = f'W/"{hashlib.sha256(data).hexdigest()[:32]}"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                status, data = 304, b""
+
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format: str, *args) -> None:
+        logging.debug(f"Fake GitHub: {format % args}")
+
+
+class FakeGitHubServer(ThreadingHTTPServer):
+    """Threaded local HTTP server standing in for https://api.github.com."""
+
+    daemon_threads = True
+
+    def __init__(self, username: str = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize FakeGitHubServer.
+
+        Args:
+            username (str): Login of the authenticated user
+                (default: GITHUB_USERNAME environment variable)
+            host (str): Interface to bind to
+            port (int): Port to bind to (default: any free port)
+        """
+        super().__init__((host, port), _RequestHandler)
+        self.github = FakeGitHub(username or os.getenv("GITHUB_USERNAME") or "octocat")
+        self.github.base_url = self.base_url
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """
+        Starts serving on a background thread.
+
+        Returns:
+            str: Base URL of the fake API
+        """
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            name="fake-github",
+            daemon=True
+        )
+        self._thread.start()
+        logging.info(f"Fake GitHub API listening on {self.base_url}")
+        return self.base_url
+
+    def stop(self) -> None:
+        """Stops the server and releases its socket."""
+        self.shutdown()
+        self.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local fake GitHub REST API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--username", default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = FakeGitHubServer(args.username, args.host, args.port)
+    logging.info(f"Fake GitHub API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
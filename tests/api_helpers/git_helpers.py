@@ -1,52 +1,365 @@
 import git
 import os
+import hashlib
 import logging
-from typing import List, Optional
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from tests.api_helpers.github_client import is_loopback_url
+
+# Base URL of the git remote; a file:// URL of a directory of bare repositories,
+# or the URL of a git HTTP server on this machine, stands in for GitHub
+GIT_REMOTE_BASE = os.getenv("GIT_REMOTE_BASE", "https://github.com").rstrip("/")
+
+# Directory of the local mirrors used as object stores of repeated clones
+GIT_MIRROR_DIR = os.getenv(
+    "GIT_MIRROR_DIR",
+    os.path.join(tempfile.gettempdir(), "github-git-mirrors")
+)
+
+# Tree entry modes of regular and executable files
+REGULAR_FILE_MODES = {"100644", "100755"}
+
+def remote_url(
+    username: str,
+    repo_name: str,
+    token: str = None,
+    remote_base: str = GIT_REMOTE_BASE
+) -> str:
+    """
+    Builds the URL a repository is cloned from and pushed to.
+
+    Args:
+        username (str): GitHub username
+        repo_name (str): Repository name
+        token (str): GitHub access token, only sent to HTTPS remotes (optional)
+        remote_base (str): Base URL of the remote (default: GIT_REMOTE_BASE)
+
+    Returns:
+        str: Repository URL
+    """
+    url = urlparse(remote_base)
+    base = remote_base
+    if token and url.scheme == "https":
+        base = f"https://{token}@{url.netloc}{url.path}"
+    return f"{base}/{username}/{repo_name}.git"
+
+def is_local_remote(remote_base: str = GIT_REMOTE_BASE) -> bool:
+    """
+    Checks whether repositories are served by a local stand-in for GitHub,
+    a directory of bare repositories or a git HTTP server on this machine.
+    Any other remote, including GitHub Enterprise, is treated as GitHub.
+
+    Args:
+        remote_base (str): Base URL of the remote (default: GIT_REMOTE_BASE)
+
+    Returns:
+        bool: True for file:// and loopback remotes
+    """
+    return urlparse(remote_base).scheme == "file" or is_loopback_url(remote_base)
+
+def create_local_repository(
+    username: str,
+    repo_name: str,
+    remote_base: str = GIT_REMOTE_BASE,
+    branch_name: str = "main"
+) -> str:
+    """
+    Seeds a repository on a local remote. Like a GitHub repository created
+    with auto_init, it gets a commit adding README.md. Under a file:// remote
+    a bare repository is created, replacing an existing one; a git HTTP
+    server must already serve the repository, which may be empty.
+
+    Args:
+        username (str): GitHub username
+        repo_name (str): Repository name
+        remote_base (str): Base URL of the remote (default: GIT_REMOTE_BASE)
+        branch_name (str): Default branch
+
+    Returns:
+        str: URL of the repository
+
+    Raises:
+        git.GitCommandError: If the remote does not accept the push
+    """
+    url = urlparse(remote_base)
+    if url.scheme == "file":
+        repo_path = os.path.join(url.path, username, f"{repo_name}.git")
+        shutil.rmtree(repo_path, ignore_errors=True)
+        logging.info(f"Creating local repository {repo_name} in {repo_path}")
+        repo = git.Repo.init(repo_path, bare=True, initial_branch=branch_name)
+        with repo.config_writer() as config:
+            # Serve partial clones (--filter) like GitHub does
+            config.set_value("uploadpack", "allowFilter", "true")
+    push_files(
+        username,
+        repo_name,
+        branch_name,
+        {"README.md": f"# {repo_name}\n"},
+        "Initial commit",
+        remote_base
+    )
+    return remote_url(username, repo_name, remote_base=remote_base)
+
+def delete_local_repository(
+    username: str,
+    repo_name: str,
+    remote_base: str = GIT_REMOTE_BASE
+) -> None:
+    """
+    Deletes a bare repository under a file:// remote. A git HTTP server
+    cannot delete repositories over git, so there every branch except
+    the default one is deleted, and the next run pushes its branches anew.
+
+    Args:
+        username (str): GitHub username
+        repo_name (str): Repository name
+        remote_base (str): Base URL of the remote (default: GIT_REMOTE_BASE)
+    """
+    url = urlparse(remote_base)
+    if url.scheme == "file":
+        logging.info(f"Deleting local repository {repo_name}")
+        shutil.rmtree(os.path.join(url.path, username, f"{repo_name}.git"), ignore_errors=True)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="git-reset-") as work_dir:
+        repo = git.Repo.init(work_dir)
+        repo.create_remote("origin", remote_url(username, repo_name, remote_base=remote_base))
+        default_ref = repo.git.ls_remote("--symref", "origin", "HEAD").split()[1]
+        branches = [
+            line.split()[1] for line in repo.git.ls_remote("--heads", "origin").splitlines()
+        ]
+        extra_branches = [branch for branch in branches if branch != default_ref]
+        if extra_branches:
+            logging.info(f"Deleting branches of {repo_name}: {', '.join(extra_branches)}")
+            repo.git.push("origin", "--delete", *extra_branches)
+
+def push_files(
+    username: str,
+    repo_name: str,
+    branch_name: str,
+    files: Dict[str, str],
+    commit_message: str,
+    remote_base: str = GIT_REMOTE_BASE
+) -> str:
+    """
+    Commits files to a branch and pushes them, the git counterpart of
+    push_commit_to_branch for remotes without the GitHub API.
+
+    Args:
+        username (str): GitHub username
+        repo_name (str): Repository name
+        branch_name (str): Branch to commit to, created if missing
+        files (dict): File content keyed by path
+        commit_message (str): Commit message
+        remote_base (str): Base URL of the remote (default: GIT_REMOTE_BASE)
+
+    Returns:
+        str: SHA of the pushed commit
+    """
+    with tempfile.TemporaryDirectory(prefix="git-push-") as work_dir:
+        repo = git.Repo.init(work_dir)
+        repo.create_remote("origin", remote_url(username, repo_name, remote_base=remote_base))
+        if repo.git.ls_remote("--heads", "origin", branch_name):
+            repo.git.fetch("--depth=1", "origin", branch_name)
+            repo.git.checkout("-b", branch_name, "FETCH_HEAD")
+        else:
+            repo.git.checkout("--orphan", branch_name)
+
+        for path, content in files.items():
+            full_path = os.path.join(work_dir, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as f:
+                f.write(content)
+        repo.index.add(list(files))
+        commit = repo.index.commit(commit_message)
+        repo.git.push("origin", f"HEAD:refs/heads/{branch_name}")
+        logging.info(f"Pushed {commit_message!r} to {repo_name}:{branch_name}")
+        return commit.hexsha
+
+def mirror_repository(
+    username: str,
+    repo_name: str,
+    token: str = None,
+    remote_base: str = GIT_REMOTE_BASE
+) -> str:
+    """
+    Creates or updates the local bare mirror of a repository. Mirrors are
+    kept per xdist worker, so concurrent fetches never share a directory.
+
+    Args:
+        username (str): GitHub username
+        repo_name (str): Repository name
+        token (str): GitHub access token (optional)
+        remote_base (str): Base URL of the remote (default: GIT_REMOTE_BASE)
+
+    Returns:
+        str: Path to the mirror
+    """
+    remote = remote_url(username, repo_name, remote_base=remote_base)
+    digest = hashlib.sha256(remote.encode("utf-8")).hexdigest()[:16]
+    worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+    mirror_path = os.path.join(GIT_MIRROR_DIR, worker, f"{digest}.git")
+
+    if os.path.isdir(mirror_path):
+        # Only objects pushed since the last clone are transferred
+        logging.info(f"Updating mirror of {repo_name} in {mirror_path}")
+        git.Repo(mirror_path).git.fetch("--prune", "origin")
+    else:
+        logging.info(f"Creating mirror of {repo_name} in {mirror_path}")
+        # The mirror's config holds the clone URL, including the token
+        os.makedirs(os.path.dirname(mirror_path), mode=0o700, exist_ok=True)
+        git.Repo.clone_from(
+            remote_url(username, repo_name, token, remote_base),
+            mirror_path,
+            mirror=True
+        )
+    return mirror_path
 
 def clone_repository(
     username: str,
     repo_name: str,
     target_dir: str,
-    token: str = None
+    token: str = None,
+    depth: Optional[int] = None,
+    filter_spec: Optional[str] = None,
+    sparse_paths: Optional[List[str]] = None,
+    use_mirror: bool = False,
+    remote_base: str = GIT_REMOTE_BASE
 ) -> str:
     """
-    Clones a GitHub repository to the specified directory.
+    Clones a GitHub repository, or its stand-in on another remote, to the
+    specified directory.
     
     Args:
         username (str): GitHub username
         repo_name (str): Repository name
         target_dir (str): Target directory for the cloned repository
         token (str): GitHub access token (optional)
+        depth (int): Number of commits fetched, shallow clone (optional)
+        filter_spec (str): Partial clone filter, e.g. "blob:none" fetches
+            file contents only when they are checked out (optional)
+        sparse_paths (list[str]): Paths checked out, all other files are
+            left out of the working tree (optional)
+        use_mirror (bool): Borrow objects from a local mirror of the repository
+            (--reference), so repeated clones fetch only new objects
+        remote_base (str): Base URL of the remote (default: GIT_REMOTE_BASE)
         
     Returns:
         str: Path to the cloned repository
     """
     # Prepare repository URL
-    if token:
-        clone_url = f"https://{token}@github.com/{username}/{repo_name}.git"
-    else:
-        clone_url = f"https://github.com/{username}/{repo_name}.git"
+    clone_url = remote_url(username, repo_name, token, remote_base)
     
     # Create target directory if it doesn't exist
     repo_path = os.path.join(target_dir, repo_name)
     os.makedirs(target_dir, exist_ok=True)
+
+    options = []
+    if depth:
+        options.append(f"--depth={depth}")
+    if filter_spec:
+        options.append(f"--filter={filter_spec}")
+    if sparse_paths:
+        options.append("--sparse")
+    if use_mirror:
+        # The clone keeps using the mirror's objects through its alternates file
+        mirror_path = mirror_repository(username, repo_name, token, remote_base)
+        options.append(f"--reference={mirror_path}")
     
     # Clone the repository
-    logging.info(f"Cloning repository {repo_name} to {repo_path}")
-    git.Repo.clone_from(clone_url, repo_path)
+    logging.info(f"Cloning repository {repo_name} to {repo_path} {' '.join(options)}".rstrip())
+    repo = git.Repo.clone_from(clone_url, repo_path, multi_options=options)
+
+    if sparse_paths:
+        # Non-cone mode accepts single files as well as directories
+        repo.git.sparse_checkout("set", "--no-cone", *sparse_paths)
     
     return repo_path
 
+def blob_sha(content: Union[str, bytes]) -> str:
+    """
+    Returns the git object id a file with the given content is stored under.
+
+    Args:
+        content (Union[str, bytes]): File content, str is encoded as UTF-8
+
+    Returns:
+        str: Blob SHA-1, as listed by git ls-tree
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+def read_tree_manifest(repo: git.Repo, ref: str = "HEAD") -> Dict[str, Tuple[str, str]]:
+    """
+    Lists all files of a commit with a single git ls-tree call. Only tree
+    objects are read, so it works in partial and sparse clones.
+
+    Args:
+        repo (git.Repo): Repository
+        ref (str): Commit to list
+
+    Returns:
+        dict: (mode, blob SHA) keyed by path
+    """
+    manifest = {}
+    for entry in repo.git.ls_tree("-r", "-z", "--full-tree", ref).split("\0"):
+        if entry:
+            info, path = entry.split("\t", 1)
+            mode, _, sha = info.split()
+            manifest[path] = (mode, sha)
+    return manifest
+
+def find_content_mismatches(
+    repo: git.Repo,
+    expected_files: Union[List[str], Dict[str, Optional[Union[str, bytes]]]],
+    ref: str = "HEAD"
+) -> List[str]:
+    """
+    Compares the files of a commit with the expected ones by their blob SHAs,
+    without reading the working tree.
+
+    Args:
+        repo (git.Repo): Repository
+        expected_files (Union[list, dict]): Expected paths, or expected content
+            keyed by path (None checks presence only)
+        ref (str): Commit to verify
+
+    Returns:
+        List[str]: Every mismatch found, empty if the content matches
+    """
+    if not isinstance(expected_files, dict):
+        expected_files = dict.fromkeys(expected_files)
+    manifest = read_tree_manifest(repo, ref)
+
+    mismatches = []
+    for path, content in expected_files.items():
+        if path not in manifest:
+            mismatches.append(f"{path}: not found")
+            continue
+        mode, sha = manifest[path]
+        if mode not in REGULAR_FILE_MODES:
+            mismatches.append(f"{path}: mode {mode} is not a regular file")
+        elif content is not None and sha != blob_sha(content):
+            mismatches.append(f"{path}: content differs (blob {sha[:10]})")
+    return mismatches
+
 def verify_repository_content(
     repo_path: str,
-    expected_files: Optional[List[str]] = None
+    expected_files: Optional[Union[List[str], Dict[str, Optional[Union[str, bytes]]]]] = None,
+    ref: str = "HEAD"
 ) -> bool:
     """
     Verifies the content of the cloned repository.
     
     Args:
         repo_path (str): Path to the cloned repository
-        expected_files (list[str]): List of expected files (optional)
+        expected_files (Union[list, dict]): Expected paths, or expected content
+            keyed by path (optional)
+        ref (str): Commit to verify
         
     Returns:
         bool: True if verification succeeded
@@ -65,11 +378,11 @@ def verify_repository_content(
     
     # Check for expected files
     if expected_files:
-        for file_path in expected_files:
-            full_path = os.path.join(repo_path, file_path)
-            if not os.path.exists(full_path):
-                logging.error(f"Expected file not found: {file_path}")
-                return False
-            logging.info(f"Found expected file: {file_path}")
+        mismatches = find_content_mismatches(repo, expected_files, ref)
+        for mismatch in mismatches:
+            logging.error(f"Unexpected repository content: {mismatch}")
+        if mismatches:
+            return False
+        logging.info(f"Found {len(expected_files)} expected files in {ref}")
     
-    return True
\ No newline at end of file
+    return True
@@ -0,0 +1,979 @@
+import requests
+import base64
+import ipaddress
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+
+from tests.api_helpers.http_cache import ConditionalCache
+from tests.api_helpers.metrics import LatencyRecorder, recorder
+from tests.api_helpers.rate_limit import RateLimitGovernor
+from tests.api_helpers.tracing import LazyJSON, Tracer, tracer
+
+# Base URL used when the client is created without one
+DEFAULT_BASE_URL = "https://api.github.com"
+
+# Default headers sent with every request made through the client
+DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "test-framework-github-client"
+}
+
+# Lower bound for the number of pooled keep-alive connections
+MIN_POOL_SIZE = 10
+
+# Largest page size accepted by GitHub list endpoints
+MAX_PER_PAGE = 100
+
+# Number of times a request rejected by a rate limit is retried
+RATE_LIMIT_RETRIES = 3
+
+
+def worker_count() -> int:
+    """
+    Returns the number of pytest-xdist workers taking part in the run.
+
+    Returns:
+        int: Worker count (1 when running without xdist)
+    """
+    try:
+        return max(1, int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1")))
+    except ValueError:
+        return 1
+
+
+def is_loopback_url(url: str) -> bool:
+    """
+    Checks whether a URL points at this machine, e.g. the fake GitHub API.
+
+    Args:
+        url (str): Base URL
+
+    Returns:
+        bool: True for localhost and loopback addresses
+    """
+    host = urlparse(url).hostname or ""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """
+    Returns a low-cardinality name of an endpoint, e.g. GET /repos/:owner/:repo.
+
+    Args:
+        method (str): HTTP method
+        path (str): API path
+
+    Returns:
+        str: Endpoint name
+    """
+    path = path.split("?", 1)[0]
+    path = re.sub(r"^/repos/[^/]+/[^/]+", "/repos/:owner/:repo", path)
+    path = re.sub(r"^/(users|orgs)/[^/]+", r"/\1/:name", path)
+    path = re.sub(r"/[0-9a-f]{40}(?=/|$)", "/:sha", path)
+    path = re.sub(r"/\d+(?=/|$)", "/:number", path)
+    return f"{method} {path}"
+
+
+class GitHubClient:
+    """GitHub REST API client reusing keep-alive connections."""
+
+    def __init__(
+        self,
+        headers: dict = None,
+        base_url: str = None,
+        pool_size: int = None,
+        cache: bool = True,
+        rate_limit: bool = True,
+        request_tracer: Optional[Tracer] = tracer,
+        latency_recorder: Optional[LatencyRecorder] = recorder
+    ):
+        """
+        Initialize GitHubClient with a pooled requests session.
+
+        Args:
+            headers (dict): Headers containing GitHub authorization token
+            base_url (str): GitHub API base URL
+                (default: BASE_URL environment variable)
+            pool_size (int): Maximum number of pooled connections
+                (default: xdist worker count, at least MIN_POOL_SIZE)
+            cache (bool): Revalidate repeated GET requests with ETags
+                (default: True)
+            rate_limit (bool): Pace requests with the governor shared by all
+                workers using the same token, never done for loopback base
+                URLs (default: True)
+            request_tracer (Tracer): Request history used for debug logs and
+                failure reports (default: process wide tracer, None disables)
+            latency_recorder (LatencyRecorder): Per-operation latency
+                histograms (default: process wide recorder, None disables)
+        """
+        self.base_url = (
+            base_url or os.getenv("BASE_URL") or DEFAULT_BASE_URL
+        ).rstrip("/")
+        self.pool_size = pool_size or max(MIN_POOL_SIZE, worker_count())
+        self.cache = ConditionalCache() if cache else None
+        # A local stand-in such as the fake GitHub API has no rate limit
+        pace = rate_limit and not is_loopback_url(self.base_url)
+        self.governor = RateLimitGovernor.for_headers(headers) if pace else None
+        self.tracer = request_tracer
+        self.recorder = latency_recorder
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.headers.update(headers or {})
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            pool_block=True
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self.session.close()
+
+    def url(self, path: str) -> str:
+        """
+        Builds an absolute API URL.
+
+        Args:
+            path (str): API path, e.g. /user/repos
+
+        Returns:
+            str: Absolute URL
+        """
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def path(self, url: str) -> str:
+        """
+        Strips the base URL from an absolute API URL.
+
+        Args:
+            url (str): Absolute URL or API path
+
+        Returns:
+            str: API path, e.g. /user/repos (unchanged for foreign URLs)
+        """
+        if url.startswith(self.base_url):
+            return url[len(self.base_url):] or "/"
+        return url
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        operation: str = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request through the pooled session.
+
+        GET responses carrying an ETag or Last-Modified header are cached and
+        revalidated with conditional requests. Mutating requests drop cached
+        responses of the repository they change.
+
+        Args:
+            method (str): HTTP method
+            path (str): API path or absolute URL
+            operation (str): Logical operation the latency is recorded under,
+                e.g. commit_files.create_tree (default: method and endpoint)
+            **kwargs: Extra arguments passed to requests.Session.request
+
+        Returns:
+            requests.Response: Response object
+        """
+        method = method.upper()
+        url = self.url(path)
+        operation = operation or endpoint_name(method, self.path(url))
+        if self.cache is None:
+            return self._send(method, url, operation, **kwargs)
+
+        if method != "GET":
+            response = self._send(method, url, operation, **kwargs)
+            if method not in ("HEAD", "OPTIONS"):
+                self.cache.invalidate(self.path(url))
+            return response
+
+        key = self.cache.key(self.path(url), kwargs.get("params"))
+        headers = {**self.cache.validators(key), **(kwargs.pop("headers", None) or {})}
+        response = self._send(method, url, operation, headers=headers, **kwargs)
+        if response.status_code == 304:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            # Evicted in the meantime, fetch the full response again
+            return self._send(method, url, operation, **kwargs)
+        self.cache.store(key, response)
+        return response
+
+    def _send(self, method: str, url: str, operation: str, **kwargs) -> requests.Response:
+        if self.governor is None:
+            return self._traced(method, url, operation, **kwargs)
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self.governor.acquire()
+            response = self._traced(method, url, operation, **kwargs)
+            delay = self.governor.update(response)
+            if delay is None or attempt == RATE_LIMIT_RETRIES:
+                return response
+            logging.info(
+                f"Retrying {method} {url} after rate limit "
+                f"(attempt {attempt + 1}/{RATE_LIMIT_RETRIES})"
+            )
+        return response
+
+    def _traced(self, method: str, url: str, operation: str, **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+        if self.recorder is not None:
+            self.recorder.record(operation, elapsed)
+        if self.tracer is not None:
+            self.tracer.record(response, elapsed)
+        return response
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def create_new_repository(
+        self,
+        repo_name: str = "TestRepository",
+        description: str = "Test repository description"
+    ) -> str:
+        """
+        Creates a new GitHub repository
+
+        Args:
+            repo_name (str): Name of the repository to create
+            description (str): Repository description
+
+        Returns:
+            str: Name of the created repository
+        """
+        create_repo_data = {
+            "name": repo_name,
+            "description": description,
+            "homepage": "https://github.com",
+            "private": False,
+            "auto_init": True  # This will initialize the repository with README.md
+        }
+
+        create_response = self.post(
+            "/user/repos",
+            json=create_repo_data,
+            operation="create_new_repository"
+        )
+        logging.debug("Create Repository Response: \n%s", LazyJSON(create_response))
+        assert create_response.status_code == 201
+        repo_name = create_response.json()['name']
+        logging.info(f"Created repository name: {repo_name}")
+        return repo_name
+
+    def iter_pages(
+        self,
+        path: str,
+        params: dict = None,
+        per_page: int = MAX_PER_PAGE,
+        operation: str = None
+    ) -> Iterator[list]:
+        """
+        Yields pages of a list endpoint, following the Link header.
+
+        Pages are requested lazily, so a consumer that stops iterating
+        early does not fetch the remaining pages.
+
+        Args:
+            path (str): API path of the list endpoint
+            params (dict): Extra query parameters
+            per_page (int): Page size (default: MAX_PER_PAGE)
+            operation (str): Operation the latency is recorded under
+
+        Yields:
+            list: Items of a single page
+        """
+        url = path
+        query = {**(params or {}), "per_page": per_page}
+        while url:
+            response = self.get(url, params=query, operation=operation)
+            assert response.status_code == 200, (
+                f"Failed to fetch {response.url}: {response.status_code}"
+            )
+            yield response.json()
+            # The next link already carries all query parameters
+            url = response.links.get("next", {}).get("url")
+            query = None
+
+    def iter_items(
+        self,
+        path: str,
+        params: dict = None,
+        per_page: int = MAX_PER_PAGE,
+        operation: str = None
+    ) -> Iterator[dict]:
+        """
+        Yields items of a list endpoint across all pages.
+
+        Args:
+            path (str): API path of the list endpoint
+            params (dict): Extra query parameters
+            per_page (int): Page size (default: MAX_PER_PAGE)
+            operation (str): Operation the latency is recorded under
+
+        Yields:
+            dict: Single item
+        """
+        for page in self.iter_pages(path, params, per_page, operation):
+            yield from page
+
+    def get_repository(self, username: str, repo_name: str) -> Optional[dict]:
+        """
+        Fetches a single repository directly.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+
+        Returns:
+            Optional[dict]: Repository data or None if it does not exist
+        """
+        response = self.get(
+            f"/repos/{username}/{repo_name}",
+            operation="get_repository"
+        )
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise AssertionError(
+                f"Unexpected status code {response.status_code} "
+                "when checking repository existence"
+            )
+        return response.json()
+
+    def repository_exists(self, username: str, repo_name: str) -> bool:
+        """
+        Checks whether a repository exists without listing user repositories.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+
+        Returns:
+            bool: True if repository exists
+        """
+        return self.get_repository(username, repo_name) is not None
+
+    def verify_repository_in_user_repos(
+        self,
+        username: str,
+        repo_name: str
+    ) -> dict:
+        """
+        Searches user repositories page by page and verifies if specific
+        repository exists. Stops at the first match.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+
+        Returns:
+            dict: Repository data
+        """
+        scanned = 0
+        matching_repo = None
+        for repo in self.iter_items(
+            f"/users/{username}/repos",
+            operation="verify_repository_in_user_repos"
+        ):
+            scanned += 1
+            if repo['name'] == repo_name:
+                matching_repo = repo
+                break
+
+        logging.info(f"Scanned {scanned} repositories for user {username}")
+        assert matching_repo is not None, f"Repository {repo_name} was not found in user's repositories"
+
+        logging.debug("Found matching repository:\n%s", LazyJSON(matching_repo))
+        return matching_repo
+
+    def create_new_branch(
+        self,
+        username: str,
+        repo_name: str,
+        branch_name: str,
+        base_branch: str = "main"
+    ) -> dict:
+        """
+        Creates a new branch in the specified repository.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the new branch
+            base_branch (str): Name of the base branch (default: main)
+
+        Returns:
+            dict: Branch creation response data
+        """
+        # Get the SHA of the base branch
+        base_branch_response = self.get(
+            f"/repos/{username}/{repo_name}/git/refs/heads/{base_branch}",
+            operation="create_new_branch.get_base_ref"
+        )
+        assert base_branch_response.status_code == 200, (
+            f"Failed to get {base_branch} branch reference"
+        )
+
+        sha = base_branch_response.json()['object']['sha']
+
+        # Create new branch
+        create_branch_data = {
+            "ref": f"refs/heads/{branch_name}",
+            "sha": sha
+        }
+
+        create_branch_response = self.post(
+            f"/repos/{username}/{repo_name}/git/refs",
+            json=create_branch_data,
+            operation="create_new_branch.create_ref"
+        )
+
+        assert create_branch_response.status_code == 201, (
+            f"Failed to create branch {branch_name}"
+        )
+        logging.info(f"Created new branch: {branch_name}")
+        logging.debug(
+            "Branch creation response:\n%s", LazyJSON(create_branch_response)
+        )
+
+        return create_branch_response.json()
+
+    def push_commit_to_branch(
+        self,
+        username: str,
+        repo_name: str,
+        branch_name: str,
+        file_content: str,
+        commit_message: str,
+        file_path: str
+    ) -> dict:
+        """
+        Pushes a commit to the specified branch through the Git Data API
+        (blob, tree, commit, reference update). put_file writes a single
+        file in fewer requests through the Contents API.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the branch
+            file_content (str): Content to commit
+            commit_message (str): Commit message
+            file_path (str): Path to the file in repository
+
+        Returns:
+            dict: Commit response data
+        """
+        return self.commit_files(
+            username,
+            repo_name,
+            branch_name,
+            {file_path: file_content},
+            commit_message
+        )
+
+    def put_file(
+        self,
+        username: str,
+        repo_name: str,
+        branch_name: str,
+        file_path: str,
+        file_content: str,
+        commit_message: str
+    ) -> dict:
+        """
+        Commits a single file through the Contents API.
+
+        Takes two requests (look up the current blob, write the file)
+        instead of the six needed by the Git Data API.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the branch
+            file_path (str): Path to the file in repository
+            file_content (str): Content to commit
+            commit_message (str): Commit message
+
+        Returns:
+            dict: Commit response data
+        """
+        contents_path = f"/repos/{username}/{repo_name}/contents/{file_path}"
+
+        # Updating an existing file requires the SHA of its current blob
+        current_response = self.get(
+            contents_path,
+            params={"ref": branch_name},
+            operation="put_file.get_contents"
+        )
+        assert current_response.status_code in (200, 404), (
+            f"Failed to get {file_path} on branch {branch_name}"
+        )
+
+        put_data = {
+            "message": commit_message,
+            "content": base64.b64encode(file_content.encode("utf-8")).decode("ascii"),
+            "branch": branch_name
+        }
+        if current_response.status_code == 200:
+            current = current_response.json()
+            # A directory is listed as an array of its entries
+            assert isinstance(current, dict) and current.get('type') == 'file', (
+                f"{file_path} on branch {branch_name} is not a file"
+            )
+            put_data["sha"] = current['sha']
+
+        put_response = self.put(
+            contents_path,
+            json=put_data,
+            operation="put_file.put_contents"
+        )
+        assert put_response.status_code in (200, 201), (
+            f"Failed to commit {file_path} to branch {branch_name}"
+        )
+        commit = put_response.json()['commit']
+
+        logging.info(f"Successfully pushed commit to branch {branch_name}")
+        logging.debug("Commit response:\n%s", LazyJSON(commit))
+
+        return commit
+
+    def commit_files(
+        self,
+        username: str,
+        repo_name: str,
+        branch_name: str,
+        files: Dict[str, str],
+        commit_message: str
+    ) -> dict:
+        """
+        Commits several files to the specified branch as a single commit.
+
+        Blobs are created concurrently while the branch head is looked up,
+        followed by one tree, one commit and one reference update, i.e.
+        N + 4 requests for N files.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the branch
+            files (Dict[str, str]): File contents keyed by path in repository
+            commit_message (str): Commit message
+
+        Returns:
+            dict: Commit response data
+        """
+        assert files, "At least one file is required to create a commit"
+        repo_path = f"/repos/{username}/{repo_name}"
+
+        def create_blob(file_content: str) -> str:
+            blob_data = {
+                "content": file_content,
+                "encoding": "utf-8"
+            }
+            blob_response = self.post(
+                f"{repo_path}/git/blobs",
+                json=blob_data,
+                operation="commit_files.create_blob"
+            )
+            assert blob_response.status_code == 201, "Failed to create blob"
+            return blob_response.json()['sha']
+
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(files) + 1)) as executor:
+            # The branch endpoint returns the head commit together with its tree
+            branch_future = executor.submit(
+                self.get,
+                f"{repo_path}/branches/{branch_name}",
+                operation="commit_files.get_branch"
+            )
+            blob_futures = {
+                file_path: executor.submit(create_blob, file_content)
+                for file_path, file_content in files.items()
+            }
+
+            branch_response = branch_future.result()
+            assert branch_response.status_code == 200, "Failed to get branch reference"
+            branch_sha = branch_response.json()['commit']['sha']
+            base_tree_sha = branch_response.json()['commit']['commit']['tree']['sha']
+            blob_shas = {
+                file_path: future.result()
+                for file_path, future in blob_futures.items()
+            }
+
+        # Create a new tree
+        tree_data = {
+            "base_tree": base_tree_sha,
+            "tree": [
+                {
+                    "path": file_path,
+                    "mode": "100644",
+                    "type": "blob",
+                    "sha": blob_sha
+                }
+                for file_path, blob_sha in blob_shas.items()
+            ]
+        }
+        create_tree_response = self.post(
+            f"{repo_path}/git/trees",
+            json=tree_data,
+            operation="commit_files.create_tree"
+        )
+        assert create_tree_response.status_code == 201, "Failed to create tree"
+        new_tree_sha = create_tree_response.json()['sha']
+
+        # Create a commit
+        commit_data = {
+            "message": commit_message,
+            "tree": new_tree_sha,
+            "parents": [branch_sha]
+        }
+        commit_response = self.post(
+            f"{repo_path}/git/commits",
+            json=commit_data,
+            operation="commit_files.create_commit"
+        )
+        assert commit_response.status_code == 201, "Failed to create commit"
+        new_commit_sha = commit_response.json()['sha']
+
+        # Update the reference
+        ref_data = {
+            "sha": new_commit_sha,
+            "force": False
+        }
+        update_ref_response = self.patch(
+            f"{repo_path}/git/refs/heads/{branch_name}",
+            json=ref_data,
+            operation="commit_files.update_ref"
+        )
+        assert update_ref_response.status_code == 200, "Failed to update reference"
+
+        logging.info(
+            f"Successfully pushed commit with {len(files)} files to branch {branch_name}"
+        )
+        logging.debug("Commit response:\n%s", LazyJSON(commit_response))
+
+        return commit_response.json()
+
+    def create_pull_request(
+        self,
+        username: str,
+        repo_name: str,
+        head_branch: str,
+        base_branch: str = "main",
+        title: str = None,
+        body: str = None
+    ) -> dict:
+        """
+        Creates a new pull request.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            head_branch (str): Name of the branch containing changes
+            base_branch (str): Name of the target branch (default: main)
+            title (str): Title of the pull request
+            body (str): Description of the pull request
+
+        Returns:
+            dict: Pull request data
+        """
+        if title is None:
+            title = f"Pull request from {head_branch}"
+        if body is None:
+            body = f"Automated pull request created from {head_branch} to {base_branch}"
+
+        pr_data = {
+            "title": title,
+            "body": body,
+            "head": head_branch,
+            "base": base_branch
+        }
+
+        create_pr_response = self.post(
+            f"/repos/{username}/{repo_name}/pulls",
+            json=pr_data,
+            operation="create_pull_request"
+        )
+
+        assert create_pr_response.status_code == 201, "Failed to create pull request"
+        logging.info(f"Created pull request: {title}")
+        return create_pr_response.json()
+
+    def verify_pull_request(
+        self,
+        username: str,
+        repo_name: str,
+        pr_number: int
+    ) -> tuple[dict, list]:
+        """
+        Verifies pull request metadata and changes.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            pr_number (int): Pull request number
+
+        Returns:
+            tuple[dict, list]: Tuple containing (pr_data, pr_files)
+        """
+        # Get PR metadata
+        pr_response = self.get(
+            f"/repos/{username}/{repo_name}/pulls/{pr_number}",
+            operation="verify_pull_request.get_pull"
+        )
+        assert pr_response.status_code == 200, f"Failed to get PR #{pr_number}"
+        pr_data = pr_response.json()
+
+        # Get PR changes
+        files_response = self.get(
+            f"/repos/{username}/{repo_name}/pulls/{pr_number}/files",
+            operation="verify_pull_request.list_files"
+        )
+        assert files_response.status_code == 200, (
+            f"Failed to get PR #{pr_number} files"
+        )
+        pr_files = files_response.json()
+
+        logging.info(f"Pull Request #{pr_number} metadata:")
+        logging.info(f"Title: {pr_data['title']}")
+        logging.info(f"State: {pr_data['state']}")
+        logging.info(f"Changed files: {len(pr_files)}")
+
+        return pr_data, pr_files
+
+    def get_ref(self, username: str, repo_name: str, ref: str) -> Optional[str]:
+        """
+        Returns the commit SHA a reference points to.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            ref (str): Reference without the refs/ prefix, e.g. heads/main
+
+        Returns:
+            Optional[str]: Commit SHA or None if the reference does not exist
+        """
+        response = self.get(
+            f"/repos/{username}/{repo_name}/git/refs/{ref}",
+            operation="get_ref"
+        )
+        if response.status_code == 404:
+            return None
+        assert response.status_code == 200, f"Failed to get reference {ref}"
+        return response.json()['object']['sha']
+
+    def create_ref(self, username: str, repo_name: str, ref: str, sha: str) -> dict:
+        """
+        Creates a reference, e.g. a branch or a lightweight tag.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            ref (str): Reference without the refs/ prefix, e.g. tags/baseline
+            sha (str): Commit SHA the reference points to
+
+        Returns:
+            dict: Reference data
+        """
+        response = self.post(
+            f"/repos/{username}/{repo_name}/git/refs",
+            json={"ref": f"refs/{ref}", "sha": sha},
+            operation="create_ref"
+        )
+        assert response.status_code == 201, f"Failed to create reference {ref}"
+        return response.json()
+
+    def update_branch(
+        self,
+        username: str,
+        repo_name: str,
+        branch_name: str,
+        sha: str,
+        force: bool = False
+    ) -> dict:
+        """
+        Points a branch at the given commit.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the branch
+            sha (str): Commit SHA
+            force (bool): Allow updates that are not fast-forwards
+
+        Returns:
+            dict: Reference data
+        """
+        response = self.patch(
+            f"/repos/{username}/{repo_name}/git/refs/heads/{branch_name}",
+            json={"sha": sha, "force": force},
+            operation="update_branch"
+        )
+        assert response.status_code == 200, f"Failed to update branch {branch_name}"
+        return response.json()
+
+    def list_branches(self, username: str, repo_name: str) -> list:
+        """
+        Lists names of all branches.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+
+        Returns:
+            list: Branch names
+        """
+        return [
+            branch['name']
+            for branch in self.iter_items(
+                f"/repos/{username}/{repo_name}/branches",
+                operation="list_branches"
+            )
+        ]
+
+    def delete_branch(self, username: str, repo_name: str, branch_name: str) -> None:
+        """
+        Deletes a branch.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            branch_name (str): Name of the branch
+        """
+        response = self.delete(
+            f"/repos/{username}/{repo_name}/git/refs/heads/{branch_name}",
+            operation="delete_branch"
+        )
+        assert response.status_code == 204, f"Failed to delete branch {branch_name}"
+        logging.info(f"Deleted branch: {branch_name}")
+
+    def list_pull_requests(
+        self,
+        username: str,
+        repo_name: str,
+        state: str = "open"
+    ) -> list:
+        """
+        Lists pull requests of a repository.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            state (str): open, closed or all (default: open)
+
+        Returns:
+            list: Pull request data
+        """
+        return list(self.iter_items(
+            f"/repos/{username}/{repo_name}/pulls",
+            params={"state": state},
+            operation="list_pull_requests"
+        ))
+
+    def close_pull_request(self, username: str, repo_name: str, pr_number: int) -> dict:
+        """
+        Closes a pull request without merging it.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository
+            pr_number (int): Pull request number
+
+        Returns:
+            dict: Pull request data
+        """
+        response = self.patch(
+            f"/repos/{username}/{repo_name}/pulls/{pr_number}",
+            json={"state": "closed"},
+            operation="close_pull_request"
+        )
+        assert response.status_code == 200, f"Failed to close PR #{pr_number}"
+        logging.info(f"Closed pull request #{pr_number}")
+        return response.json()
+
+    def delete_repository(self, username: str, repo_name: str) -> None:
+        """
+        Deletes a repository.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository to delete
+        """
+        url = self.url(f"/repos/{username}/{repo_name}")
+        delete_response = self.delete(url, operation="delete_repository")
+
+        if delete_response.status_code != 204:
+            error_message = (
+                f"Failed to delete repository {repo_name}.\n"
+                f"Status code: {delete_response.status_code}\n"
+                f"Response: {delete_response.text}\n"
+                f"URL: {url}\n"
+                f"Headers: {dict(self.session.headers)}"
+            )
+            logging.error(error_message)
+            raise AssertionError(error_message)
+
+        logging.info(f"Successfully deleted repository: {repo_name}")
+
+    def verify_repository_not_exists(
+        self,
+        username: str,
+        repo_name: str
+    ) -> bool:
+        """
+        Verifies that a repository does not exist.
+
+        Args:
+            username (str): GitHub username
+            repo_name (str): Name of the repository to check
+
+        Returns:
+            bool: True if repository does not exist
+        """
+        if not self.repository_exists(username, repo_name):
+            logging.info(f"Confirmed repository {repo_name} does not exist")
+            return True
+        logging.info(
+            f"Repository {repo_name} still exists when it should have been deleted"
+        )
+        return False
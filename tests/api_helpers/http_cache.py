@@ -0,0 +1,183 @@
+import copy
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+from urllib.parse import urlencode
+
+import requests
+
+# Default bounds of the conditional request cache
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Repository scoped API paths, e.g. /repos/{owner}/{repo}/git/refs/heads/main
+REPO_PATH_PATTERN = re.compile(r"^/repos/(?P<owner>[^/?]+)/(?P<repo>[^/?]+)")
+
+# Listing endpoints whose content changes when repositories are created or deleted
+LISTING_PATH_PATTERN = re.compile(r"^/(user|users/[^/?]+|orgs/[^/?]+)/repos(\?|$)")
+
+
+def invalidated_prefixes(path: str) -> List[str]:
+    """
+    Returns cache key prefixes made stale by a mutating request.
+
+    Args:
+        path (str): API path of the mutating request
+
+    Returns:
+        List[str]: Key prefixes to drop from the cache
+    """
+    match = REPO_PATH_PATTERN.match(path)
+    if match:
+        repo_prefix = f"/repos/{match['owner']}/{match['repo']}"
+        if path.rstrip("/") == repo_prefix:
+            # The repository itself changed, e.g. it was deleted or renamed
+            return [repo_prefix, "/user/repos", "/users/", "/orgs/"]
+        return [repo_prefix]
+    if LISTING_PATH_PATTERN.match(path):
+        return ["/user/repos", "/users/", "/orgs/"]
+    return []
+
+
+class ConditionalCache:
+    """
+    LRU cache of GET responses revalidated with ETag/Last-Modified.
+
+    Cached responses are never served without asking GitHub first; they are
+    only returned when GitHub answers 304 Not Modified, which does not count
+    against the rate limit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Initialize ConditionalCache.
+
+        Args:
+            max_entries (int): Maximum number of cached responses
+            max_bytes (int): Maximum total size of cached response bodies
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(path: str, params: dict = None) -> str:
+        """
+        Builds the cache key of a request.
+
+        Args:
+            path (str): API path or absolute URL
+            params (dict): Query parameters
+
+        Returns:
+            str: Cache key
+        """
+        if not params:
+            return path
+        separator = "&" if "?" in path else "?"
+        return f"{path}{separator}{urlencode(params, doseq=True)}"
+
+    def validators(self, key: str) -> dict:
+        """
+        Returns conditional request headers for a cached response.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            dict: If-None-Match/If-Modified-Since headers (empty if not cached)
+        """
+        with self._lock:
+            response = self._entries.get(key)
+        if response is None:
+            return {}
+        headers = {}
+        if "ETag" in response.headers:
+            headers["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        return headers
+
+    def get(self, key: str) -> Optional[requests.Response]:
+        """
+        Returns a copy of a cached response and marks it as recently used.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[requests.Response]: Cached response or None
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        cached = copy.copy(response)
+        cached.from_cache = True
+        return cached
+
+    def store(self, key: str, response: requests.Response) -> None:
+        """
+        Stores a successful response carrying a validator.
+
+        Args:
+            key (str): Cache key
+            response (requests.Response): Response to store
+        """
+        if response.status_code != 200:
+            return
+        if "ETag" not in response.headers and "Last-Modified" not in response.headers:
+            return
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = response
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drops entries made stale by a mutating request on the given path.
+
+        Args:
+            path (str): API path of the mutating request
+        """
+        prefixes = tuple(invalidated_prefixes(path))
+        if not prefixes:
+            return
+        with self._lock:
+            stale = [key for key in self._entries if key.startswith(prefixes)]
+            for key in stale:
+                self._discard(key)
+        if stale:
+            logging.debug(f"Invalidated {len(stale)} cached responses after change of {path}")
+
+    def clear(self) -> None:
+        """Drops all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _discard(self, key: str) -> None:
+        response = self._entries.pop(key, None)
+        if response is not None:
+            self._size -= len(response.content)
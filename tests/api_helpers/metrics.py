@@ -0,0 +1,196 @@
+import math
+import threading
+from typing import Dict
+
+# Linear sub-buckets per power of two; 64 keeps the relative error below ~1.6%
+SUB_BUCKETS = 64
+
+# Smallest recorded latency, values are stored in whole microseconds
+UNIT = 1e-6
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram with logarithmic buckets split into linear sub-buckets.
+
+    Memory is bounded by the dynamic range rather than the number of samples,
+    and histograms from different processes merge by adding bucket counts.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < SUB_BUCKETS:
+            return value
+        exponent = value.bit_length() - 1
+        shift = exponent - int(math.log2(SUB_BUCKETS))
+        return (shift + 1) * SUB_BUCKETS + ((value >> shift) - SUB_BUCKETS)
+
+    @staticmethod
+    def _value(index: int) -> int:
+        if index < SUB_BUCKETS:
+            return index
+        shift = index // SUB_BUCKETS - 1
+        sub_bucket = index % SUB_BUCKETS + SUB_BUCKETS
+        # Middle of the bucket
+        return (sub_bucket << shift) + ((1 << shift) >> 1)
+
+    def record(self, seconds: float) -> None:
+        """
+        Records a single latency.
+
+        Args:
+            seconds (float): Latency in seconds
+        """
+        index = self._index(max(0, int(seconds / UNIT)))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the latency below which the given percentage of samples fall.
+
+        Args:
+            percent (float): Percentile, e.g. 95
+
+        Returns:
+            float: Latency in seconds (0 when empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(self._value(index) * UNIT, self.min), self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Adds the samples of another histogram.
+
+        Args:
+            other (LatencyHistogram): Histogram to merge
+        """
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> dict:
+        """
+        Returns count, mean, percentiles and maximum in milliseconds.
+
+        Returns:
+            dict: Summary statistics
+        """
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 1),
+            "mean_ms": round(self.total / self.count * 1000, 1) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 1),
+            "p95_ms": round(self.percentile(95) * 1000, 1),
+            "p99_ms": round(self.percentile(99) * 1000, 1),
+            "max_ms": round(self.max * 1000, 1)
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "counts": {str(index): count for index, count in self.counts.items()},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"] if data["min"] is not None else math.inf
+        histogram.max = data["max"]
+        return histogram
+
+
+class LatencyRecorder:
+    """Latency histograms keyed by logical GitHub operation."""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.histograms)
+
+    def record(self, operation: str, seconds: float) -> None:
+        """
+        Records the latency of a single request.
+
+        Args:
+            operation (str): Operation name, e.g. commit_files.create_tree
+            seconds (float): Latency in seconds
+        """
+        with self._lock:
+            histogram = self.histograms.get(operation)
+            if histogram is None:
+                histogram = self.histograms[operation] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def merge(self, other: "LatencyRecorder") -> None:
+        """
+        Adds the histograms of another recorder, e.g. of an xdist worker.
+
+        Args:
+            other (LatencyRecorder): Recorder to merge
+        """
+        with self._lock:
+            for operation, histogram in other.histograms.items():
+                self.histograms.setdefault(operation, LatencyHistogram()).merge(histogram)
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Returns summary statistics per operation, slowest in total first.
+
+        Returns:
+            Dict[str, dict]: Summary keyed by operation
+        """
+        with self._lock:
+            summaries = {
+                operation: histogram.summary()
+                for operation, histogram in self.histograms.items()
+            }
+        return dict(sorted(summaries.items(), key=lambda item: -item[1]["total_ms"]))
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                operation: histogram.to_dict()
+                for operation, histogram in self.histograms.items()
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyRecorder":
+        recorder = cls()
+        recorder.histograms = {
+            operation: LatencyHistogram.from_dict(histogram)
+            for operation, histogram in data.items()
+        }
+        return recorder
+
+
+# Recorder shared by all clients of this process
+recorder = LatencyRecorder()
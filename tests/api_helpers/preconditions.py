@@ -0,0 +1,164 @@
+import logging
+from typing import Optional
+
+from tests.api_helpers.github_helpers import (
+    create_new_branch,
+    create_new_repository,
+    create_pull_request,
+    delete_repository,
+    push_commit_to_branch,
+    repository_exists
+)
+
+# File edited by the GUI pull request flow
+README_PATH = "README.md"
+
+# Commit message GitHub's web editor proposes for README.md, also the PR title
+README_COMMIT_MESSAGE = "Update README.md"
+
+
+class RepositoryState:
+    """State a repository was put into by a PreconditionBuilder."""
+
+    def __init__(self, repo_name: str):
+        """
+        Initialize RepositoryState.
+
+        Args:
+            repo_name (str): Repository name
+        """
+        self.repo_name = repo_name
+        self.branch_name: Optional[str] = None
+        self.pull_request: Optional[dict] = None
+
+    def __repr__(self) -> str:
+        return f"RepositoryState({self.repo_name!r}, branch={self.branch_name!r})"
+
+
+class PreconditionBuilder:
+    """
+    Puts a repository into the state a GUI test starts from through the
+    GitHub API, so each test only automates the screen it is testing.
+
+    Steps run immediately and can be chained, e.g.
+    PreconditionBuilder(headers, username, name).with_repository()
+    .with_readme_change("update-readme", "content").with_pull_request().build()
+    """
+
+    def __init__(self, headers: dict, username: str, repo_name: str):
+        """
+        Initialize PreconditionBuilder.
+
+        Args:
+            headers (dict): Headers containing GitHub authorization token
+            username (str): GitHub username owning the repository
+            repo_name (str): Repository name
+        """
+        self.headers = headers
+        self.username = username
+        self.state = RepositoryState(repo_name)
+
+    @property
+    def repo_name(self) -> str:
+        return self.state.repo_name
+
+    def without_repository(self) -> "PreconditionBuilder":
+        """
+        Deletes the repository if it exists, e.g. before testing its creation.
+
+        Returns:
+            PreconditionBuilder: The builder itself
+        """
+        if repository_exists(self.headers, self.username, self.repo_name):
+            delete_repository(self.headers, self.username, self.repo_name)
+        return self
+
+    def with_repository(
+        self,
+        description: str = "Test repository created through the API"
+    ) -> "PreconditionBuilder":
+        """
+        Creates the repository, initialized with a README, unless it exists.
+
+        Args:
+            description (str): Repository description
+
+        Returns:
+            PreconditionBuilder: The builder itself
+        """
+        if not repository_exists(self.headers, self.username, self.repo_name):
+            create_new_repository(self.headers, self.repo_name, description)
+        return self
+
+    def with_readme_change(
+        self,
+        branch_name: str,
+        content: str,
+        commit_message: str = README_COMMIT_MESSAGE,
+        base_branch: str = "main"
+    ) -> "PreconditionBuilder":
+        """
+        Creates a branch whose README.md is replaced with the given content.
+
+        Args:
+            branch_name (str): Name of the new branch
+            content (str): New README.md content
+            commit_message (str): Commit message
+            base_branch (str): Branch the new branch starts from (default: main)
+
+        Returns:
+            PreconditionBuilder: The builder itself
+        """
+        create_new_branch(
+            self.headers, self.username, self.repo_name, branch_name, base_branch
+        )
+        push_commit_to_branch(
+            self.headers,
+            self.username,
+            self.repo_name,
+            branch_name,
+            content,
+            commit_message,
+            README_PATH
+        )
+        self.state.branch_name = branch_name
+        return self
+
+    def with_pull_request(
+        self,
+        title: str = README_COMMIT_MESSAGE,
+        body: str = None,
+        base_branch: str = "main"
+    ) -> "PreconditionBuilder":
+        """
+        Opens a pull request from the branch created by with_readme_change.
+
+        Args:
+            title (str): Title of the pull request
+            body (str): Description of the pull request
+            base_branch (str): Target branch (default: main)
+
+        Returns:
+            PreconditionBuilder: The builder itself
+        """
+        assert self.state.branch_name, "with_readme_change() must run before with_pull_request()"
+        self.state.pull_request = create_pull_request(
+            self.headers,
+            self.username,
+            self.repo_name,
+            self.state.branch_name,
+            base_branch,
+            title,
+            body
+        )
+        return self
+
+    def build(self) -> RepositoryState:
+        """
+        Returns the state the repository was put into.
+
+        Returns:
+            RepositoryState: Repository state
+        """
+        logging.info(f"Preconditions ready: {self.state}")
+        return self.state
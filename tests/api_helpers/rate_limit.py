@@ -0,0 +1,204 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Iterator, Optional
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Sustained request rate and burst size shared by all workers using one token.
+# A rate of 0 disables pacing (rate limit responses are still honoured).
+DEFAULT_RATE = float(os.getenv("GITHUB_RATE_LIMIT_PER_SECOND", "15"))
+DEFAULT_BURST = float(os.getenv("GITHUB_RATE_LIMIT_BURST", "30"))
+
+# Pacing by the remaining primary rate limit budget starts once fewer than
+# this many requests are left until the reset
+LOW_BUDGET_THRESHOLD = int(os.getenv("GITHUB_RATE_LIMIT_LOW_BUDGET", "500"))
+
+# Lowest rate used when pacing by the remaining primary rate limit budget
+MIN_BUDGET_RATE = 0.2
+
+# Upper bound of a single sleep, so the shared state is re-read regularly
+MAX_SLEEP = 5.0
+
+# Pause used for secondary rate limits that come without a Retry-After header
+DEFAULT_RETRY_AFTER = 60.0
+
+
+@contextlib.contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    with open(path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class RateLimitGovernor:
+    """
+    Token bucket pacing GitHub requests across processes.
+
+    The bucket lives in a JSON file guarded by a file lock, so every
+    pytest-xdist worker (and any concurrent run) using the same token draws
+    from one budget. Once X-RateLimit-Remaining runs low the rate is spread
+    over the time left until X-RateLimit-Reset, and Retry-After or an
+    exhausted limit pauses all workers until it passes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float = DEFAULT_RATE,
+        burst: float = DEFAULT_BURST,
+        state_dir: str = None
+    ):
+        """
+        Initialize RateLimitGovernor.
+
+        Args:
+            name (str): Identifier of the shared budget, e.g. a token hash
+            rate (float): Sustained requests per second (0 disables pacing)
+            burst (float): Bucket capacity
+            state_dir (str): Directory of the shared state file
+                (default: system temp directory)
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        state_dir = state_dir or tempfile.gettempdir()
+        self.state_path = os.path.join(state_dir, f"github-rate-limit-{name}.json")
+        self.lock_path = f"{self.state_path}.lock"
+        self._thread_lock = threading.Lock()
+
+    @classmethod
+    def for_headers(cls, headers: dict) -> "RateLimitGovernor":
+        """
+        Returns the governor shared by every client using the same credentials.
+
+        Args:
+            headers (dict): Headers containing GitHub authorization token
+
+        Returns:
+            RateLimitGovernor: Governor for these credentials
+        """
+        authorization = (headers or {}).get("Authorization", "anonymous")
+        name = hashlib.sha256(authorization.encode()).hexdigest()[:16]
+        return cls(name)
+
+    @contextlib.contextmanager
+    def _state(self) -> Iterator[dict]:
+        with self._thread_lock, _file_lock(self.lock_path):
+            try:
+                with open(self.state_path) as state_file:
+                    state = json.load(state_file)
+            except (OSError, ValueError):
+                state = {}
+            yield state
+            tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as state_file:
+                json.dump(state, state_file)
+            os.replace(tmp_path, self.state_path)
+
+    def _effective_rate(self, state: dict, now: float) -> float:
+        rate = self.rate
+        remaining = state.get("remaining")
+        reset = state.get("reset", 0)
+        if remaining is not None and remaining < LOW_BUDGET_THRESHOLD and reset > now:
+            budget_rate = max(MIN_BUDGET_RATE, remaining / (reset - now))
+            rate = min(rate, budget_rate) if rate else budget_rate
+        return rate
+
+    def _take(self, state: dict, now: float) -> float:
+        paused_until = state.get("paused_until", 0)
+        if paused_until > now:
+            return paused_until - now
+
+        rate = self._effective_rate(state, now)
+        if not rate:
+            return 0.0
+
+        updated_at = state.get("updated_at", now)
+        tokens = min(
+            self.burst,
+            state.get("tokens", self.burst) + max(0.0, now - updated_at) * rate
+        )
+        state["updated_at"] = now
+        if tokens >= 1:
+            state["tokens"] = tokens - 1
+            return 0.0
+        state["tokens"] = tokens
+        return (1 - tokens) / rate
+
+    def acquire(self) -> None:
+        """Blocks until the shared budget allows sending one request."""
+        while True:
+            with self._state() as state:
+                wait = self._take(state, time.time())
+            if wait <= 0:
+                return
+            time.sleep(min(wait, MAX_SLEEP))
+
+    def update(self, response: requests.Response) -> Optional[float]:
+        """
+        Updates the shared budget from rate limit response headers.
+
+        Args:
+            response (requests.Response): GitHub response
+
+        Returns:
+            Optional[float]: Seconds to wait before retrying if the request
+                was rejected by a rate limit, otherwise None
+        """
+        headers = response.headers
+        now = time.time()
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        retry_after = headers.get("Retry-After")
+
+        limited = response.status_code in (403, 429) and (
+            retry_after is not None
+            or remaining == "0"
+            or "rate limit" in response.text.lower()
+        )
+        if remaining is None and not limited:
+            return None
+
+        with self._state() as state:
+            if remaining is not None and reset is not None:
+                state["remaining"] = int(remaining)
+                state["reset"] = int(reset)
+            if not limited:
+                return None
+
+            if retry_after is not None:
+                paused_until = now + float(retry_after)
+            elif remaining == "0" and reset is not None:
+                paused_until = float(reset) + 1
+            else:
+                paused_until = now + DEFAULT_RETRY_AFTER
+            state["paused_until"] = max(state.get("paused_until", 0), paused_until)
+            delay = state["paused_until"] - now
+
+        logging.warning(
+            f"GitHub rate limit hit ({response.status_code}), "
+            f"pausing all workers for {delay:.0f}s"
+        )
+        return delay
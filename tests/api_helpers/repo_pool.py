@@ -0,0 +1,266 @@
+import contextlib
+import logging
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
+
+from tests.api_helpers.async_github_client import fan_out
+from tests.api_helpers.github_client import GitHubClient
+
+# Lightweight tag marking the commit a pooled repository is reset to
+BASELINE_TAG = "pool-baseline"
+
+# Number of repositories provisioned per worker
+DEFAULT_POOL_SIZE = int(os.getenv("REPO_POOL_SIZE", "2"))
+
+# Seconds to wait for a free repository before failing
+LEASE_TIMEOUT = float(os.getenv("REPO_POOL_LEASE_TIMEOUT", "300"))
+
+# Attempts to provision a repository before its lease fails
+PROVISION_ATTEMPTS = int(os.getenv("REPO_POOL_PROVISION_ATTEMPTS", "3"))
+
+# Seconds to wait before the second attempt, doubled for every further one
+PROVISION_BACKOFF = 2.0
+
+# Keep pooled repositories after the session, so the next run reuses them
+KEEP_REPOSITORIES = os.getenv("REPO_POOL_KEEP", "true").lower() == "true"
+
+
+class PooledRepository:
+    """Repository leased from a RepositoryPool."""
+
+    def __init__(self, name: str, baseline_sha: str, default_branch: str = "main"):
+        """
+        Initialize PooledRepository.
+
+        Args:
+            name (str): Repository name
+            baseline_sha (str): Commit the default branch is reset to
+            default_branch (str): Name of the default branch
+        """
+        self.name = name
+        self.baseline_sha = baseline_sha
+        self.default_branch = default_branch
+
+    def __repr__(self) -> str:
+        return f"PooledRepository({self.name!r})"
+
+
+class ProvisioningError(Exception):
+    """Placeholder queued for a repository whose provisioning failed."""
+
+    def __init__(self, name: str, error: Exception):
+        super().__init__(f"{name}: {error}")
+        self.name = name
+
+
+class RepositoryPool:
+    """
+    Pre-provisioned repositories leased to tests and recycled on release.
+
+    Creating and deleting repositories is slow and rate limited, so pooled
+    repositories are reset instead: open pull requests are closed, extra
+    branches are deleted and the default branch is force-updated to the
+    baseline commit.
+    """
+
+    def __init__(
+        self,
+        client: GitHubClient,
+        username: str,
+        prefix: str,
+        size: int = DEFAULT_POOL_SIZE,
+        keep: bool = KEEP_REPOSITORIES
+    ):
+        """
+        Initialize RepositoryPool.
+
+        Args:
+            client (GitHubClient): Client used to manage repositories
+            username (str): GitHub username owning the repositories
+            prefix (str): Repository name prefix, unique per worker
+            size (int): Number of repositories to provision
+            keep (bool): Keep repositories after close() for the next run
+        """
+        self.client = client
+        self.username = username
+        self.names = [f"{prefix}-{index}" for index in range(size)]
+        self.keep = keep
+        self._available: queue.Queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, size),
+            thread_name_prefix="repo-pool"
+        )
+
+    def start(self) -> "RepositoryPool":
+        """
+        Starts provisioning all repositories in the background.
+
+        Returns:
+            RepositoryPool: The pool itself
+        """
+        for name in self.names:
+            self._executor.submit(self._provision, name)
+        return self
+
+    def _provision(self, name: str) -> None:
+        for attempt in range(1, PROVISION_ATTEMPTS + 1):
+            try:
+                self._available.put(self._prepare(name))
+                return
+            except Exception as e:
+                logging.error(
+                    f"Failed to provision pooled repository {name} "
+                    f"(attempt {attempt}/{PROVISION_ATTEMPTS}): {e}"
+                )
+                if attempt == PROVISION_ATTEMPTS:
+                    # The lease taking this placeholder provisions the slot again
+                    self._available.put(ProvisioningError(name, e))
+                else:
+                    time.sleep(PROVISION_BACKOFF * 2 ** (attempt - 1))
+
+    def _prepare(self, name: str) -> PooledRepository:
+        """
+        Creates a repository, or resets one left from a previous run,
+        and records its baseline.
+
+        Args:
+            name (str): Repository name
+
+        Returns:
+            PooledRepository: Repository ready to be leased
+        """
+        if self.client.get_repository(self.username, name) is None:
+            self.client.create_new_repository(
+                name,
+                "Pooled test repository, reset between tests"
+            )
+            baseline_sha = None
+        else:
+            baseline_sha = self.client.get_ref(
+                self.username, name, f"tags/{BASELINE_TAG}"
+            )
+
+        if baseline_sha is None:
+            baseline_sha = self.client.get_ref(self.username, name, "heads/main")
+            self.client.create_ref(
+                self.username, name, f"tags/{BASELINE_TAG}", baseline_sha
+            )
+            repository = PooledRepository(name, baseline_sha)
+        else:
+            # Left over from a previous run, possibly in a dirty state
+            repository = PooledRepository(name, baseline_sha)
+            self.reset(repository)
+
+        logging.info(f"Pooled repository ready: {name}")
+        return repository
+
+    def reset(self, repository: PooledRepository) -> None:
+        """
+        Restores a repository to its baseline state.
+
+        Args:
+            repository (PooledRepository): Repository to reset
+        """
+        name = repository.name
+        fan_out(
+            lambda pr: self.client.close_pull_request(self.username, name, pr['number']),
+            self.client.list_pull_requests(self.username, name)
+        )
+        fan_out(
+            lambda branch: self.client.delete_branch(self.username, name, branch),
+            [
+                branch for branch in self.client.list_branches(self.username, name)
+                if branch != repository.default_branch
+            ]
+        )
+        self.client.update_branch(
+            self.username,
+            name,
+            repository.default_branch,
+            repository.baseline_sha,
+            force=True
+        )
+        logging.info(f"Reset pooled repository {name} to {repository.baseline_sha[:7]}")
+
+    def lease(self, timeout: float = LEASE_TIMEOUT) -> PooledRepository:
+        """
+        Takes a repository out of the pool, waiting until one is ready.
+
+        Args:
+            timeout (float): Seconds to wait for a free repository
+
+        Returns:
+            PooledRepository: Leased repository
+        """
+        try:
+            repository = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise AssertionError(
+                f"No pooled repository became available within {timeout:.0f}s"
+            )
+        if isinstance(repository, ProvisioningError):
+            self._executor.submit(self._provision, repository.name)
+            raise AssertionError(f"Pooled repository could not be provisioned: {repository}")
+        logging.info(f"Leased pooled repository: {repository.name}")
+        return repository
+
+    def release(self, repository: PooledRepository) -> None:
+        """
+        Resets a repository and returns it to the pool. A repository that
+        cannot be reset is deleted and provisioned again.
+
+        Args:
+            repository (PooledRepository): Repository returned by lease()
+        """
+        try:
+            self.reset(repository)
+        except Exception as e:
+            logging.error(f"Failed to reset pooled repository {repository.name}: {e}")
+            self._executor.submit(self._replace, repository.name)
+            return
+        self._available.put(repository)
+
+    def _replace(self, name: str) -> None:
+        try:
+            self.client.delete_repository(self.username, name)
+        except AssertionError as e:
+            logging.error(f"Failed to delete pooled repository {name}: {e}")
+        self._provision(name)
+
+    @contextlib.contextmanager
+    def leased(self) -> Iterator[PooledRepository]:
+        """
+        Leases a repository for the duration of a with block.
+
+        Yields:
+            PooledRepository: Leased repository
+        """
+        repository = self.lease()
+        try:
+            yield repository
+        finally:
+            self.release(repository)
+
+    def close(self) -> List[str]:
+        """
+        Waits for background work and deletes the repositories unless the
+        pool keeps them for the next run.
+
+        Returns:
+            List[str]: Names of deleted repositories
+        """
+        self._executor.shutdown(wait=True)
+        if self.keep:
+            return []
+        results = fan_out(
+            lambda name: self.client.delete_repository(self.username, name),
+            self.names,
+            return_exceptions=True
+        )
+        return [
+            name for name, result in zip(self.names, results)
+            if not isinstance(result, Exception)
+        ]
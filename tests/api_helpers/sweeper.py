@@ -0,0 +1,141 @@
+import argparse
+import fnmatch
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List
+
+from tests.api_helpers.async_github_client import (
+    DEFAULT_CONCURRENCY,
+    AsyncGitHubClient,
+    run_sync
+)
+from tests.api_helpers.github_client import GitHubClient
+from tests.api_helpers.repo_pool import KEEP_REPOSITORIES
+
+# Names of repositories created by the test suites. Pooled repositories are
+# only orphans when the pool deletes them at the end of a session, otherwise
+# they are kept for the next run on purpose.
+DEFAULT_PATTERNS = [
+    "test-repo-playwright",
+    "test-repo-playwright-gw*",
+    "TestRepository",
+    *([] if KEEP_REPOSITORIES else ["test-pool-*"])
+]
+
+# Repositories younger than this may still be used by a running session
+DEFAULT_MIN_AGE = timedelta(hours=1)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+
+
+def find_orphaned_repositories(
+    client: GitHubClient,
+    patterns: Iterable[str] = DEFAULT_PATTERNS,
+    min_age: timedelta = DEFAULT_MIN_AGE
+) -> List[dict]:
+    """
+    Lists repositories of the authenticated user left behind by test runs.
+
+    Args:
+        client (GitHubClient): Client authenticated as the repository owner
+        patterns (Iterable[str]): Shell-style repository name patterns
+        min_age (timedelta): Minimum time since creation and last push
+
+    Returns:
+        List[dict]: Repository data of matching repositories
+    """
+    patterns = list(patterns)
+    cutoff = datetime.now(timezone.utc) - min_age
+    orphaned = []
+    for repo in client.iter_items("/user/repos", params={"type": "owner"}):
+        if not any(fnmatch.fnmatchcase(repo['name'], pattern) for pattern in patterns):
+            continue
+        last_activity = max(
+            _parse_timestamp(repo[field])
+            for field in ("created_at", "pushed_at")
+            if repo.get(field)
+        )
+        if last_activity <= cutoff:
+            orphaned.append(repo)
+    return orphaned
+
+
+def sweep_orphaned_repositories(
+    headers: dict,
+    username: str,
+    patterns: Iterable[str] = DEFAULT_PATTERNS,
+    min_age: timedelta = DEFAULT_MIN_AGE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    dry_run: bool = False
+) -> List[str]:
+    """
+    Deletes repositories left behind by crashed test runs concurrently.
+
+    Args:
+        headers (dict): Headers containing GitHub authorization token
+        username (str): GitHub username owning the repositories
+        patterns (Iterable[str]): Shell-style repository name patterns
+        min_age (timedelta): Minimum time since creation and last push
+        concurrency (int): Maximum number of concurrent deletions
+        dry_run (bool): Only report what would be deleted
+
+    Returns:
+        List[str]: Names of deleted (or, in dry run, matching) repositories
+    """
+    async_client = AsyncGitHubClient(headers=headers, concurrency=concurrency)
+    try:
+        names = [
+            repo['name']
+            for repo in find_orphaned_repositories(async_client.client, patterns, min_age)
+        ]
+        logging.info(f"Found {len(names)} orphaned repositories: {', '.join(names)}")
+        if dry_run or not names:
+            return names
+        deleted = run_sync(async_client.delete_repositories(username, names))
+    finally:
+        async_client.close()
+
+    logging.info(f"Deleted {len(deleted)} of {len(names)} orphaned repositories")
+    return deleted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Delete GitHub repositories left behind by crashed test runs"
+    )
+    parser.add_argument(
+        "--pattern",
+        action="append",
+        dest="patterns",
+        help="Repository name pattern, may be repeated (default: test suite repositories)"
+    )
+    parser.add_argument(
+        "--min-age-minutes",
+        type=float,
+        default=DEFAULT_MIN_AGE.total_seconds() / 60,
+        help="Only delete repositories without activity for this long"
+    )
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    names = sweep_orphaned_repositories(
+        headers={"Authorization": f"token {os.getenv('GITHUB_API_KEY')}"},
+        username=os.getenv("GITHUB_USERNAME"),
+        patterns=args.patterns or DEFAULT_PATTERNS,
+        min_age=timedelta(minutes=args.min_age_minutes),
+        concurrency=args.concurrency,
+        dry_run=args.dry_run
+    )
+    action = "Would delete" if args.dry_run else "Deleted"
+    print(f"{action} {len(names)} repositories")
+    for name in names:
+        print(f"  {name}")
+
+
+if __name__ == "__main__":
+    main()
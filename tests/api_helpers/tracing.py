@@ -0,0 +1,182 @@
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+from collections import deque
+from typing import List, Optional
+
+import requests
+
+# Logger receiving one debug record per traced request
+logger = logging.getLogger("github.http")
+
+# Number of requests kept per process for failure reports
+DEFAULT_MAX_RECORDS = int(os.getenv("GITHUB_TRACE_MAX_RECORDS", "200"))
+
+# Number of body bytes kept per request and response
+DEFAULT_BODY_LIMIT = int(os.getenv("GITHUB_TRACE_BODY_LIMIT", "4096"))
+
+# Fraction of successful requests recorded; failed requests are always kept
+DEFAULT_SAMPLE_RATE = float(os.getenv("GITHUB_TRACE_SAMPLE_RATE", "1.0"))
+
+
+def _render_body(body: Optional[bytes], size: int) -> str:
+    if not body:
+        return ""
+    if len(body) == size:
+        try:
+            return json.dumps(json.loads(body), indent=2)
+        except ValueError:
+            pass
+    text = body.decode("utf-8", "replace")
+    if len(body) < size:
+        text += f"\n... truncated, {size} bytes in total"
+    return text
+
+
+class LazyJSON:
+    """Pretty-prints JSON only when converted to a string, e.g. by an enabled log handler."""
+
+    def __init__(self, payload: object, limit: int = DEFAULT_BODY_LIMIT):
+        """
+        Initialize LazyJSON.
+
+        Args:
+            payload (object): JSON serializable object or requests.Response
+            limit (int): Maximum number of rendered characters
+        """
+        self.payload = payload
+        self.limit = limit
+
+    def __str__(self) -> str:
+        payload = self.payload
+        if isinstance(payload, requests.Response):
+            try:
+                payload = payload.json()
+            except ValueError:
+                payload = payload.text
+        text = json.dumps(payload, indent=2) if not isinstance(payload, str) else payload
+        if len(text) > self.limit:
+            return f"{text[:self.limit]}\n... truncated, {len(text)} characters in total"
+        return text
+
+
+class RequestTrace:
+    """Single HTTP exchange with bodies cut to a size limit."""
+
+    __slots__ = (
+        "sequence", "method", "url", "status", "elapsed",
+        "request_body", "request_size", "response_body", "response_size"
+    )
+
+    def __init__(
+        self,
+        sequence: int,
+        response: requests.Response,
+        elapsed: float,
+        body_limit: int
+    ):
+        request_body = response.request.body or b""
+        if isinstance(request_body, str):
+            request_body = request_body.encode("utf-8")
+        self.sequence = sequence
+        self.method = response.request.method
+        self.url = response.request.url
+        self.status = response.status_code
+        self.elapsed = elapsed
+        self.request_body = request_body[:body_limit]
+        self.request_size = len(request_body)
+        self.response_body = response.content[:body_limit]
+        self.response_size = len(response.content)
+
+    def __str__(self) -> str:
+        lines = [f"{self.method} {self.url} -> {self.status} ({self.elapsed * 1000:.0f} ms)"]
+        if self.request_body:
+            lines.append(f"Request:\n{_render_body(self.request_body, self.request_size)}")
+        if self.response_body:
+            lines.append(f"Response:\n{_render_body(self.response_body, self.response_size)}")
+        return "\n".join(lines)
+
+
+class Tracer:
+    """Keeps a bounded, sampled history of GitHub API requests."""
+
+    def __init__(
+        self,
+        max_records: int = DEFAULT_MAX_RECORDS,
+        body_limit: int = DEFAULT_BODY_LIMIT,
+        sample_rate: float = DEFAULT_SAMPLE_RATE
+    ):
+        """
+        Initialize Tracer.
+
+        Args:
+            max_records (int): Number of requests kept
+            body_limit (int): Number of body bytes kept per request and response
+            sample_rate (float): Fraction of successful requests recorded
+        """
+        self.body_limit = body_limit
+        self.sample_rate = sample_rate
+        self._records: deque = deque(maxlen=max_records)
+        self._sequence = itertools.count(1)
+        self._last_sequence = 0
+        self._lock = threading.Lock()
+
+    def record(self, response: requests.Response, elapsed: float) -> None:
+        """
+        Records a request unless it is sampled out.
+
+        Args:
+            response (requests.Response): Received response
+            elapsed (float): Request duration in seconds
+        """
+        if response.status_code < 400 and random.random() >= self.sample_rate:
+            return
+        with self._lock:
+            sequence = next(self._sequence)
+            self._last_sequence = sequence
+        trace = RequestTrace(sequence, response, elapsed, self.body_limit)
+        with self._lock:
+            self._records.append(trace)
+        logger.debug("%s", trace)
+
+    def mark(self) -> int:
+        """
+        Returns a position in the history, e.g. taken when a test starts.
+
+        Returns:
+            int: Sequence number of the last recorded request
+        """
+        with self._lock:
+            return self._last_sequence
+
+    def since(self, mark: int = 0) -> List[RequestTrace]:
+        """
+        Returns requests recorded after the given mark.
+
+        Args:
+            mark (int): Value returned by mark()
+
+        Returns:
+            List[RequestTrace]: Recorded requests, oldest first
+        """
+        with self._lock:
+            return [trace for trace in self._records if trace.sequence > mark]
+
+    def render(self, mark: int = 0) -> str:
+        """
+        Renders requests recorded after the given mark as text.
+
+        Args:
+            mark (int): Value returned by mark()
+
+        Returns:
+            str: Rendered trace (empty if nothing was recorded)
+        """
+        return "\n\n".join(str(trace) for trace in self.since(mark))
+
+
+# Tracer shared by all clients of this process
+tracer = Tracer()
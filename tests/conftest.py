@@ -1,16 +1,74 @@
 import pytest
 from pathlib import Path
 import os 
+import logging
 
 import sys
 sys.path.append("./helpers/")
 
 import allure
-from playwright.sync_api import Page
+from playwright.sync_api import Browser, BrowserContext
+from tests.api_helpers.fake_github import FAKE_BASE_URL, FAKE_URL_ENV, FakeGitHubServer
+from tests.api_helpers.github_helpers import get_client
+from tests.api_helpers.repo_pool import RepositoryPool
+from tests.api_helpers.sweeper import sweep_orphaned_repositories
+from tests.GUI.auth import login_storage_state
+from tests.GUI.network import NETWORK_FILTER, RouteFilter
+
+# Plugins are listed after the plugins they import
+pytest_plugins = [
+    "tests.plugins.artifacts",
+    "tests.plugins.dependencies",
+    "tests.plugins.scheduling",
+    "tests.plugins.durations",
+    "tests.plugins.environment",
+    "tests.plugins.failure_artifacts",
+    "tests.plugins.latency",
+    "tests.plugins.strict_waits"
+]
+
+# In-process fake GitHub API started when BASE_URL=fake
+fake_github_server = None
 
-# Configure parallel test execution using the number of available CPU cores
 def pytest_configure(config):
-    config.option.numprocesses = os.cpu_count() or 1
+    start_fake_github()
+
+def start_fake_github():
+    """
+    Points BASE_URL at an in-process fake GitHub API when BASE_URL=fake.
+    The controller starts the server and xdist workers inherit its address,
+    so all workers share one fake.
+    """
+    global fake_github_server
+    if os.getenv("BASE_URL") != FAKE_BASE_URL:
+        return
+    if not os.getenv(FAKE_URL_ENV):
+        fake_github_server = FakeGitHubServer()
+        os.environ[FAKE_URL_ENV] = fake_github_server.start()
+    os.environ["BASE_URL"] = os.environ[FAKE_URL_ENV]
+
+def pytest_sessionstart(session):
+    """
+    Deletes repositories left behind by crashed runs before the session
+    starts when SWEEP_ORPHANED_REPOS=true. Runs once, in the controller.
+    """
+    if hasattr(session.config, "workerinput") or session.config.option.collectonly:
+        return
+    if os.getenv("SWEEP_ORPHANED_REPOS", "false").lower() != "true":
+        return
+    deleted = sweep_orphaned_repositories(
+        headers={"Authorization": f"token {os.getenv('GITHUB_API_KEY')}"},
+        username=os.getenv("GITHUB_USERNAME")
+    )
+    if deleted:
+        logging.info(f"Deleted {len(deleted)} orphaned repositories: {', '.join(deleted)}")
+
+def pytest_unconfigure(config):
+    global fake_github_server
+    if fake_github_server is not None:
+        fake_github_server.stop()
+        os.environ.pop(FAKE_URL_ENV, None)
+        fake_github_server = None
 
 # Fixture providing path to test data directory that persists for entire test session
 @pytest.fixture(scope="session") 
@@ -18,57 +76,78 @@ def test_data_dir():
     return Path(__file__).parent / "test_data"
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
+def repo_pool():
     """
-    Browser context configuration for Playwright
+    Session-level pool of pre-provisioned repositories, unique per xdist worker.
+    Repositories are provisioned in the background and reset on release.
     """
-    return {
-        **browser_context_args,
-        "viewport": {
-            "width": 1920,
-            "height": 1080,
-        },
-        "record_video_dir": "test-results/videos" if os.getenv("RECORD_VIDEO") else None,
-    }
+    worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+    pool = RepositoryPool(
+        get_client({"Authorization": f"token {os.getenv('GITHUB_API_KEY')}"}),
+        os.getenv("GITHUB_USERNAME"),
+        prefix=f"test-pool-{worker}"
+    ).start()
+    yield pool
+    pool.close()
 
 @pytest.fixture(scope="session")
-def browser_context(playwright):
-    browser = playwright.chromium.launch()
-    context = browser.new_context(
-        animations_disabled=True  # Wyłącza wszystkie animacje CSS
+def auth_storage_state(browser: Browser):
+    """
+    Authenticated storage state produced once per worker by LoginPage and
+    cached on disk until it expires.
+    """
+    return login_storage_state(
+        browser,
+        os.getenv("GITHUB_USERNAME"),
+        os.getenv("GITHUB_PASSWORD")
     )
-    page = context.new_page()
-    return context, page
 
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
+@pytest.fixture
+def browser_context_args(browser_context_args, request):
     """
-    Adds screenshots to Allure reports when a test fails.
+    Browser context configuration for Playwright. Contexts start logged in,
+    tests exercising the login opt out with
+    @pytest.mark.browser_context_args(storage_state=None); the storage state
+    is only resolved, and the login only performed, for tests not opting out.
+    Videos are recorded to a temp directory by pytest-playwright and kept
+    only for failed tests.
     """
-    outcome = yield
-    report = outcome.get_result()
-    
-    if report.when == "call" and report.failed:
-        if "page" in item.funcargs:
-            page: Page = item.funcargs["page"]
-            allure.attach(
-                page.screenshot(full_page=True),
-                name="screenshot",
-                attachment_type=allure.attachment_type.PNG
-            )
-            allure.attach(
-                page.content(),
-                name="html",
-                attachment_type=allure.attachment_type.HTML
-            )
+    context_args = {
+        **browser_context_args,
+        "reduced_motion": "reduce",
+        "viewport": {
+            "width": 1920,
+            "height": 1080,
+        },
+    }
+    marker = request.node.get_closest_marker("browser_context_args")
+    if marker is None or "storage_state" not in marker.kwargs:
+        context_args["storage_state"] = request.getfixturevalue("auth_storage_state")
+    return context_args
 
-@pytest.fixture(autouse=True)
-def allure_attach_env():
+@pytest.fixture
+def network_filter(request):
     """
-    Adds environment information to Allure report.
+    Blocks images, fonts and analytics in browser contexts of a test. Configured
+    per test with @pytest.mark.network_filter(allow=[...], deny=[...], enabled=...),
+    blocked and loaded request counts are attached to the Allure report.
     """
-    allure.attach.file(
-        "requirements.txt",
-        name="Dependencies",
+    marker = request.node.get_closest_marker("network_filter")
+    options = dict(marker.kwargs) if marker else {}
+    if not options.pop("enabled", NETWORK_FILTER):
+        yield None
+        return
+    route_filter = RouteFilter(**options)
+    yield route_filter
+    allure.attach(
+        route_filter.summary(),
+        name="Network filter",
         attachment_type=allure.attachment_type.TEXT
-    )
\ No newline at end of file
+    )
+
+@pytest.fixture
+def context(context: BrowserContext, network_filter):
+    """pytest-playwright's per-test context with network filtering."""
+    if network_filter is not None:
+        network_filter.attach(context)
+    return context
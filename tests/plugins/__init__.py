@@ -0,0 +1 @@
+# pusty plik
@@ -0,0 +1,102 @@
+import logging
+import os
+import shutil
+from pathlib import Path
+
+import allure
+import pytest
+from playwright.sync_api import BrowserContext, Error, Page
+from pytest_playwright.pytest_playwright import truncate_file_name
+from slugify import slugify
+
+# Upper bound of videos and traces retained by all workers together
+ARTIFACTS_MAX_BYTES = int(float(os.getenv("ARTIFACTS_MAX_MB", "500")) * 1024 * 1024)
+
+# Allure attachment types of retained artifacts by file suffix
+ATTACHMENT_TYPES = {
+    ".webm": allure.attachment_type.WEBM,
+    ".zip": allure.attachment_type.ZIP,
+    ".png": allure.attachment_type.PNG
+}
+
+
+# Videos recorded by the pages of a test's browser context
+recorded_videos_key = pytest.StashKey[list]()
+
+
+def _directory_size(path: Path) -> int:
+    return sum(entry.stat().st_size for entry in path.rglob("*") if entry.is_file())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def delete_output_dir():
+    """
+    Replaces pytest-playwright's cleanup of the output directory, which every
+    xdist worker runs on its own and so deletes artifacts retained by faster
+    workers. pytest_sessionstart cleans it once, before workers start.
+    """
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    outcome = yield
+    if fixturedef.argname == "context" and outcome.excinfo is None:
+        context = outcome.get_result()
+        if isinstance(context, BrowserContext):
+            videos = request.node.stash.setdefault(recorded_videos_key, [])
+
+            def on_page(page: Page) -> None:
+                if page.video:
+                    videos.append(page.video)
+
+            context.on("page", on_page)
+
+
+def _delete_recordings(videos: list) -> None:
+    """
+    Deletes the recordings pytest-playwright keeps in its session temp
+    directory until the browser closes. Retained videos were copied to
+    the output directory by then.
+    """
+    for video in videos:
+        try:
+            Path(video.path()).unlink(missing_ok=True)
+        except (Error, OSError) as e:
+            logging.warning(f"Failed to delete video recording: {e}")
+
+
+def pytest_sessionstart(session):
+    if hasattr(session.config, "workerinput"):
+        return
+    shutil.rmtree(session.config.getoption("--output"), ignore_errors=True)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    """
+    Attaches the video and trace pytest-playwright retained for a failed test
+    to the Allure report, or drops them when the output directory already
+    exceeds ARTIFACTS_MAX_MB. Recordings of passing tests are deleted right
+    away; their traces are discarded by pytest-playwright when it stops tracing.
+    """
+    yield
+    # The context is closed by now, so its videos are complete
+    _delete_recordings(item.stash.get(recorded_videos_key, []))
+
+    output_dir = Path(item.config.getoption("--output"))
+    test_dir = output_dir / truncate_file_name(slugify(item.nodeid))
+    if not test_dir.is_dir():
+        return
+
+    if _directory_size(output_dir) > ARTIFACTS_MAX_BYTES:
+        shutil.rmtree(test_dir, ignore_errors=True)
+        logging.warning(
+            f"Artifacts exceed {ARTIFACTS_MAX_BYTES // (1024 * 1024)} MB, "
+            f"dropped video and trace of {item.nodeid}"
+        )
+        return
+
+    for path in sorted(test_dir.iterdir()):
+        attachment_type = ATTACHMENT_TYPES.get(path.suffix)
+        if attachment_type is not None:
+            allure.attach.file(str(path), name=path.name, attachment_type=attachment_type)
@@ -0,0 +1,106 @@
+from typing import Dict, List, Set
+
+import pytest
+
+# Node ids of tests that failed or were skipped in this process
+failed_steps: Set[str] = set()
+
+
+def _scope_prefix(item: pytest.Item) -> str:
+    # Node id of the class or module a test is declared in
+    return item.nodeid.split("@", 1)[0].rsplit("::", 1)[0]
+
+
+def resolve_dependencies(items: List[pytest.Item]) -> Dict[pytest.Item, List[pytest.Item]]:
+    """
+    Resolves the steps declared with @pytest.mark.depends_on. Steps are named
+    after test functions of the same class, or of the same module for tests
+    outside a class; parametrized tests depend on all their instances.
+
+    Args:
+        items (List[pytest.Item]): Collected tests
+
+    Returns:
+        Dict[pytest.Item, List[pytest.Item]]: Selected dependencies of each test
+            declaring any, dependencies that are not selected are left out
+
+    Raises:
+        pytest.UsageError: If a step names a test that does not exist
+    """
+    by_name: Dict[tuple, List[pytest.Item]] = {}
+    for item in items:
+        by_name.setdefault((_scope_prefix(item), item.originalname), []).append(item)
+
+    dependencies = {}
+    for item in items:
+        names = [name for marker in item.iter_markers("depends_on") for name in marker.args]
+        if not names:
+            continue
+        owner = item.cls or item.module
+        resolved = []
+        for name in names:
+            if not callable(getattr(owner, name, None)):
+                raise pytest.UsageError(f"{item.nodeid} depends on unknown test {name}")
+            resolved.extend(by_name.get((_scope_prefix(item), name), []))
+        dependencies[item] = resolved
+    return dependencies
+
+
+def order_steps(items: List[pytest.Item], dependencies: Dict[pytest.Item, List[pytest.Item]]) -> None:
+    """
+    Reorders tests in place so that every step runs after its dependencies,
+    keeping the collection order otherwise.
+
+    Args:
+        items (List[pytest.Item]): Collected tests
+        dependencies (Dict[pytest.Item, List[pytest.Item]]): Resolved dependencies
+
+    Raises:
+        pytest.UsageError: If steps depend on each other in a cycle
+    """
+    ordered: List[pytest.Item] = []
+    done: Set[pytest.Item] = set()
+    visiting: Set[pytest.Item] = set()
+
+    def visit(item: pytest.Item) -> None:
+        if item in done:
+            return
+        if item in visiting:
+            raise pytest.UsageError(f"Circular step dependency at {item.nodeid}")
+        visiting.add(item)
+        for dependency in dependencies.get(item, []):
+            visit(dependency)
+        visiting.discard(item)
+        done.add(item)
+        ordered.append(item)
+
+    for item in items:
+        visit(item)
+    items[:] = ordered
+
+
+def pytest_collection_modifyitems(config, items):
+    # Grouping the chains onto one xdist worker is done by the scheduling plugin
+    dependencies = resolve_dependencies(items)
+    if dependencies:
+        order_steps(items, dependencies)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Skips a step before its fixtures are set up when a step it depends on failed."""
+    for marker in item.iter_markers("depends_on"):
+        for name in marker.args:
+            prefix = _scope_prefix(item)
+            failed = [
+                nodeid for nodeid in failed_steps
+                if nodeid.startswith(f"{prefix}::{name}")
+                and nodeid[len(prefix) + len(name) + 2:][:1] in ("", "[", "@")
+            ]
+            if failed:
+                pytest.skip(f"depends on {name}, which did not pass")
+
+
+def pytest_runtest_logreport(report):
+    if report.failed or (report.skipped and report.when != "teardown"):
+        failed_steps.add(report.nodeid)
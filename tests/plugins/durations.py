@@ -0,0 +1,176 @@
+import os
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import pytest
+
+from tests.plugins.scheduling import group_name
+
+# Order tests by their history unless set to false
+ORDER_BY_HISTORY = os.getenv("ORDER_BY_HISTORY", "true").lower() == "true"
+
+# Key of the history in pytest's cache (.pytest_cache)
+CACHE_KEY = "github-tests/durations"
+
+# A test that failed in one of this many runs is scheduled first
+RECENT_FAILURE_RUNS = 3
+
+# Entries of tests and fixtures not seen for this many runs are dropped
+MAX_AGE_RUNS = 50
+
+# Number of slowest fixtures listed in the terminal summary with -v
+SLOWEST_FIXTURES = 5
+
+# Weight of the latest duration in the moving average
+SMOOTHING = 0.5
+
+# Key of the fixture durations in xdist workeroutput
+WORKEROUTPUT_KEY = "fixture_durations"
+
+# Fixture setup times measured by this process, [count, total seconds] by name
+fixture_durations: Dict[str, list] = defaultdict(lambda: [0, 0.0])
+
+# Duration of all phases and outcome per test reported in this session
+test_results: Dict[str, dict] = {}
+
+
+def base_nodeid(nodeid: str) -> str:
+    """
+    Strips the group suffix xdist adds to node ids for --dist loadgroup.
+
+    Args:
+        nodeid (str): Node id, e.g. API/test_a.py::TestA::test_b@test_a.TestA
+
+    Returns:
+        str: Node id without group suffix
+    """
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
+
+
+def load_history(config: pytest.Config) -> dict:
+    cache = getattr(config, "cache", None)
+    history = cache.get(CACHE_KEY, None) if cache is not None else None
+    return history or {"run": 0, "tests": {}, "fixtures": {}}
+
+
+def _smooth(previous: dict, value: float) -> float:
+    if not previous:
+        return value
+    return SMOOTHING * value + (1 - SMOOTHING) * previous["duration"]
+
+
+def order_items(items: List[pytest.Item], history: dict) -> None:
+    """
+    Reorders tests in place: units containing a recently failed test first,
+    then the longest units. Tests that must run on one worker form a single
+    unit and keep their relative order.
+
+    Args:
+        items (List[pytest.Item]): Collected tests
+        history (dict): Stored history
+    """
+    tests = history["tests"]
+    current_run = history["run"] + 1
+    known = [entry["duration"] for entry in tests.values()]
+    default_duration = sum(known) / len(known) if known else 0.0
+
+    units: Dict[str, List[pytest.Item]] = {}
+    for item in items:
+        units.setdefault(group_name(item) or base_nodeid(item.nodeid), []).append(item)
+
+    def unit_key(unit: List[pytest.Item]) -> tuple:
+        entries = [tests.get(base_nodeid(item.nodeid)) for item in unit]
+        failed_recently = any(
+            entry and entry.get("failed_run")
+            and current_run - entry["failed_run"] <= RECENT_FAILURE_RUNS
+            for entry in entries
+        )
+        duration = sum(entry["duration"] if entry else default_duration for entry in entries)
+        return (not failed_recently, -duration)
+
+    items[:] = [item for unit in sorted(units.values(), key=unit_key) for item in unit]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    # xdist workers must agree on the order, they read the same stored history
+    if ORDER_BY_HISTORY and items:
+        order_items(items, load_history(config))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    started = time.perf_counter()
+    yield
+    entry = fixture_durations[f"{fixturedef.scope}:{fixturedef.argname}"]
+    entry[0] += 1
+    entry[1] += time.perf_counter() - started
+
+
+def pytest_runtest_logreport(report):
+    # In the controller this receives the reports of all xdist workers
+    result = test_results.setdefault(
+        base_nodeid(report.nodeid),
+        {"duration": 0.0, "failed": False, "skipped": False}
+    )
+    result["duration"] += report.duration
+    result["failed"] = result["failed"] or report.failed
+    result["skipped"] = result["skipped"] or report.skipped
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    for name, (count, total) in getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY, {}).items():
+        entry = fixture_durations[name]
+        entry[0] += count
+        entry[1] += total
+
+
+def pytest_sessionfinish(session):
+    """
+    Stores test durations and outcomes of this run in pytest's cache.
+    xdist workers only hand their fixture setup times to the controller.
+    """
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput[WORKEROUTPUT_KEY] = dict(fixture_durations)
+        return
+    if getattr(config, "cache", None) is None or not test_results:
+        return
+
+    history = load_history(config)
+    run = history["run"] + 1
+    for nodeid, result in test_results.items():
+        if result["skipped"]:
+            continue
+        previous = history["tests"].get(nodeid)
+        history["tests"][nodeid] = {
+            "duration": round(_smooth(previous, result["duration"]), 3),
+            "failed_run": run if result["failed"] else (previous or {}).get("failed_run"),
+            "seen_run": run
+        }
+    for name, (count, total) in fixture_durations.items():
+        previous = history["fixtures"].get(name)
+        history["fixtures"][name] = {
+            "duration": round(_smooth(previous, total / count), 3),
+            "seen_run": run
+        }
+    for section in ("tests", "fixtures"):
+        history[section] = {
+            key: entry for key, entry in history[section].items()
+            if run - entry["seen_run"] < MAX_AGE_RUNS
+        }
+    history["run"] = run
+    config.cache.set(CACHE_KEY, history)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config.option.verbose < 1 or not fixture_durations:
+        return
+    slowest = sorted(fixture_durations.items(), key=lambda entry: -entry[1][1])[:SLOWEST_FIXTURES]
+    terminalreporter.write_sep("-", "slowest fixture setups")
+    for name, (count, total) in slowest:
+        terminalreporter.write_line(f"{total:8.2f}s  {count:4d}x  {name}")
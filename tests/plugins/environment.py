@@ -0,0 +1,129 @@
+import os
+import platform
+import re
+from importlib import metadata
+from pathlib import Path
+
+import allure
+import pytest
+from playwright.sync_api import Browser
+
+# Dependencies of the test suite
+REQUIREMENTS_PATH = Path(__file__).parents[2] / "requirements.txt"
+
+# Key of the worker's environment in xdist workeroutput
+WORKEROUTPUT_KEY = "environment"
+
+# Environments reported by xdist workers
+worker_environments_key = pytest.StashKey[list]()
+
+# Versions of browsers launched by this process, e.g. {"chromium": "121.0.6167.57"}
+browser_versions: dict = {}
+
+
+def _installed_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "not installed"
+
+
+def read_dependencies(path: Path = REQUIREMENTS_PATH) -> dict:
+    """
+    Returns installed versions of the packages listed in requirements.txt.
+
+    Args:
+        path (Path): Requirements file
+
+    Returns:
+        dict: Installed version keyed by package name
+    """
+    dependencies = {}
+    for line in path.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            name = re.split(r"[<>=!~;\[ ]", line, maxsplit=1)[0]
+            dependencies[name] = _installed_version(name)
+    return dependencies
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", " ")
+
+
+def write_environment_properties(report_dir: str, environment: dict) -> Path:
+    """
+    Writes environment.properties, shown as Environment in the Allure report.
+
+    Args:
+        report_dir (str): Allure results directory
+        environment (dict): Values keyed by name
+
+    Returns:
+        Path: Written file
+    """
+    path = Path(report_dir) / "environment.properties"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(
+        f"{key.replace(' ', '.')}={_escape(value)}\n" for key, value in environment.items()
+    ))
+    return path
+
+
+def pytest_configure(config):
+    config.stash[worker_environments_key] = []
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    outcome = yield
+    if fixturedef.argname == "browser" and outcome.excinfo is None:
+        browser = outcome.get_result()
+        # --setup-plan and --setup-only produce placeholders instead of a Browser
+        if isinstance(browser, Browser):
+            browser_versions[browser.browser_type.name] = browser.version
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if data is not None:
+        node.config.stash[worker_environments_key].append(data)
+
+
+def pytest_sessionfinish(session):
+    """
+    Writes environment metadata once per session. xdist workers only hand
+    their browser versions to the controller, which merges them.
+    """
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput[WORKEROUTPUT_KEY] = {"browsers": dict(browser_versions)}
+        return
+
+    report_dir = getattr(config.option, "allure_report_dir", None)
+    if not report_dir or config.option.collectonly:
+        return
+
+    workers = config.stash[worker_environments_key]
+    browsers = dict(browser_versions)
+    for worker in workers:
+        browsers.update(worker["browsers"])
+
+    dependencies = read_dependencies()
+    environment = {
+        "Python": platform.python_version(),
+        "Platform": platform.platform(),
+        "Playwright": dependencies.get("playwright") or _installed_version("playwright"),
+        "pytest": dependencies.get("pytest") or _installed_version("pytest"),
+        "Workers": len(workers) or 1,
+        **{f"Browser {name}": version for name, version in sorted(browsers.items())},
+        "Base URL": os.getenv("BASE_URL", ""),
+        "Base URL GUI": os.getenv("BASE_URL_GUI", "")
+    }
+    write_environment_properties(report_dir, environment)
+    allure.global_attach(
+        "\n".join(f"{name}=={version}" for name, version in dependencies.items()),
+        name="Dependencies",
+        attachment_type=allure.attachment_type.TEXT
+    )
@@ -0,0 +1,170 @@
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+import allure
+import allure_commons
+import pytest
+from playwright.sync_api import Page
+
+from tests.api_helpers.tracing import tracer
+
+# Size limit of text attachments (HTML, request traces), longer ones are truncated
+TEXT_MAX_BYTES = int(os.getenv("ATTACHMENT_TEXT_MAX_KB", "512")) * 1024
+
+# JPEG quality of failure screenshots
+SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "70"))
+
+# Position in the GitHub request trace when a test started
+trace_mark_key = pytest.StashKey[int]()
+
+# Attachment types cut to TEXT_MAX_BYTES
+TEXT_TYPES = {
+    allure.attachment_type.TEXT,
+    allure.attachment_type.HTML,
+    allure.attachment_type.JSON
+}
+
+
+class AttachmentWriter:
+    """
+    Writes Allure attachments on a background thread.
+
+    The attachment is added to the running test synchronously, but its file
+    is written later. Files are named after the SHA-256 of their content, so
+    identical attachments of different tests, e.g. the same error page,
+    reference a single file.
+    """
+
+    def __init__(self, text_max_bytes: int = TEXT_MAX_BYTES):
+        """
+        Initialize AttachmentWriter.
+
+        Args:
+            text_max_bytes (int): Size limit of text attachments
+        """
+        self.text_max_bytes = text_max_bytes
+        self._reporter = None
+        self._written: set = set()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def start(self, config) -> None:
+        """
+        Connects the writer to the Allure reporter of a pytest session.
+
+        Args:
+            config (pytest.Config): pytest configuration
+        """
+        listener = config.pluginmanager.get_plugin("allure_listener")
+        if listener is None:
+            # Allure reporting disabled (no --alluredir)
+            return
+        self._reporter = listener.allure_logger
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="allure-writer")
+
+    def attach(
+        self,
+        body: Union[str, bytes],
+        name: str,
+        attachment_type: allure.attachment_type
+    ) -> None:
+        """
+        Adds an attachment to the running test and writes it in the background.
+
+        Args:
+            body (Union[str, bytes]): Attachment content
+            name (str): Attachment name
+            attachment_type (allure.attachment_type): Attachment type
+        """
+        if self._reporter is None:
+            return
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # Relies on AllureReporter._attach, which registers the attachment
+        # without writing it and names the file after the given uuid
+        file_name = self._reporter._attach(digest, name=name, attachment_type=attachment_type)
+        with self._lock:
+            if file_name in self._written:
+                return
+            self._written.add(file_name)
+        self._executor.submit(self._write, body, file_name, attachment_type)
+
+    def _write(self, body: bytes, file_name: str, attachment_type: allure.attachment_type) -> None:
+        if attachment_type in TEXT_TYPES and len(body) > self.text_max_bytes:
+            body = body[:self.text_max_bytes] + (
+                f"\n... truncated, {len(body)} bytes in total".encode("utf-8")
+            )
+        try:
+            allure_commons.plugin_manager.hook.report_attached_data(body=body, file_name=file_name)
+        except Exception as e:
+            logging.error(f"Failed to write attachment {file_name}: {e}")
+
+    def close(self) -> None:
+        """Waits until all attachments are written."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._reporter = None
+
+
+# Writer shared by the hooks of this process
+attachment_writer = AttachmentWriter()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    # After allure-pytest registered its listener
+    attachment_writer.start(config)
+
+
+def pytest_sessionfinish(session):
+    attachment_writer.close()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    item.stash[trace_mark_key] = tracer.mark()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Adds screenshots and GitHub API request traces to Allure reports
+    when a test fails. Only the capture runs here, attachments are
+    truncated and written in the background.
+    """
+    outcome = yield
+    report = outcome.get_result()
+
+    if report.failed:
+        trace = tracer.render(item.stash.get(trace_mark_key, 0))
+        if trace:
+            attachment_writer.attach(
+                trace,
+                name="GitHub API requests",
+                attachment_type=allure.attachment_type.TEXT
+            )
+
+    if report.when == "call" and report.failed:
+        if "page" in item.funcargs:
+            page: Page = item.funcargs["page"]
+            attachment_writer.attach(
+                page.screenshot(
+                    type="jpeg",
+                    quality=SCREENSHOT_QUALITY,
+                    scale="css",
+                    timeout=5000
+                ),
+                name="screenshot",
+                attachment_type=allure.attachment_type.JPG
+            )
+            attachment_writer.attach(
+                page.content(),
+                name="html",
+                attachment_type=allure.attachment_type.HTML
+            )
@@ -0,0 +1,80 @@
+import json
+import os
+from pathlib import Path
+
+import allure
+import pytest
+
+from tests.api_helpers.metrics import LatencyRecorder, recorder
+
+# JSON artifact with merged latency percentiles per GitHub operation
+REPORT_PATH = os.getenv("GITHUB_LATENCY_REPORT", "test-results/github-latency.json")
+
+# Key of the serialized histograms in xdist workeroutput
+WORKEROUTPUT_KEY = "github_latency"
+
+# Histograms received from xdist workers, merged by the controller
+worker_recorders_key = pytest.StashKey[list]()
+
+# Merged summary written by the controller
+latency_summary_key = pytest.StashKey[dict]()
+
+
+def _render(summary: dict) -> str:
+    lines = [f"{'operation':<45} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'total':>10}"]
+    for operation, stats in summary.items():
+        lines.append(
+            f"{operation:<45} {stats['count']:>6} {stats['p50_ms']:>6.0f}ms "
+            f"{stats['p95_ms']:>6.0f}ms {stats['p99_ms']:>6.0f}ms {stats['total_ms'] / 1000:>9.1f}s"
+        )
+    return "\n".join(lines)
+
+
+def pytest_configure(config):
+    config.stash[worker_recorders_key] = []
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if data:
+        node.config.stash[worker_recorders_key].append(LatencyRecorder.from_dict(data))
+
+
+def pytest_sessionfinish(session):
+    """
+    Hands the histograms of a worker to the controller, which merges them
+    with its own, writes p50/p95/p99 per operation to REPORT_PATH and
+    attaches them to the Allure report once.
+    """
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput[WORKEROUTPUT_KEY] = recorder.to_dict()
+        return
+
+    merged = LatencyRecorder()
+    merged.merge(recorder)
+    for worker_recorder in config.stash[worker_recorders_key]:
+        merged.merge(worker_recorder)
+    if not merged:
+        return
+
+    path = Path(REPORT_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    summary = merged.summary()
+    path.write_text(json.dumps(summary, indent=2))
+    config.stash[latency_summary_key] = summary
+    allure.global_attach(
+        json.dumps(summary, indent=2),
+        name="GitHub API latency",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    summary = config.stash.get(latency_summary_key, None)
+    if not summary:
+        return
+    terminalreporter.write_sep("-", "GitHub API latency")
+    terminalreporter.write_line(_render(summary))
+    terminalreporter.write_line(f"Written to {REPORT_PATH}")
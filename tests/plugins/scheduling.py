@@ -0,0 +1,234 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from tests.plugins.dependencies import resolve_dependencies
+
+# Worker processes per CPU when only I/O-bound (API, Git) tests are selected
+IO_WORKERS_PER_CPU = float(os.getenv("IO_WORKERS_PER_CPU", "4"))
+
+# Memory reserved per worker running a browser in MB
+BROWSER_WORKER_MB = int(os.getenv("BROWSER_WORKER_MB", "600"))
+
+# Set in the collection subprocess, which writes the selected workload there
+WORKLOAD_REPORT_ENV = "PYTEST_WORKLOAD_REPORT"
+
+# Seconds the collection subprocess may take
+PROBE_TIMEOUT = 120
+
+# Fixtures that launch a browser
+BROWSER_FIXTURES = {"browser", "context", "page"}
+
+# Group assigned to a test by assign_groups
+group_key = pytest.StashKey[Optional[str]]()
+
+# Worker count chosen for -n auto, shown in the report header
+worker_plan_key = pytest.StashKey[str]()
+
+# Memory statistics of the Linux kernel
+MEMINFO_PATH = "/proc/meminfo"
+
+
+def class_group(item: pytest.Item) -> Optional[str]:
+    """
+    Returns the group of a test sharing class-scoped fixtures with the other
+    tests of its class, which depend on each other's state.
+
+    Args:
+        item (pytest.Item): Test item
+
+    Returns:
+        Optional[str]: Group name, or None if the test shares no class state
+    """
+    if item.cls is None:
+        return None
+    for fixturedefs in item._fixtureinfo.name2fixturedefs.values():
+        if fixturedefs and fixturedefs[-1].scope == "class":
+            return f"{item.module.__name__.rsplit('.', 1)[-1]}.{item.cls.__name__}"
+    return None
+
+
+def _chain_name(item: pytest.Item) -> str:
+    return f"{item.module.__name__.rsplit('.', 1)[-1]}.{item.originalname}"
+
+
+def assign_groups(items: List[pytest.Item]) -> None:
+    """
+    Assigns the xdist group of tests that must run on one worker: classes
+    sharing class-scoped fixtures and chains of steps declared with
+    @pytest.mark.depends_on. Overlapping groups are merged.
+
+    Args:
+        items (List[pytest.Item]): Collected tests
+    """
+    parents: Dict[str, str] = {}
+
+    def find(name: str) -> str:
+        while parents.setdefault(name, name) != name:
+            name = parents[name]
+        return name
+
+    def union(first: str, second: str) -> None:
+        first, second = find(first), find(second)
+        if first != second:
+            parents[max(first, second)] = min(first, second)
+
+    members = {}
+    for item in items:
+        name = class_group(item)
+        if name:
+            members[item] = name
+    for item, dependencies in resolve_dependencies(items).items():
+        members.setdefault(item, _chain_name(item))
+        for dependency in dependencies:
+            union(members[item], members.setdefault(dependency, _chain_name(dependency)))
+
+    for item in items:
+        item.stash[group_key] = find(members[item]) if item in members else None
+
+
+def group_name(item: pytest.Item) -> Optional[str]:
+    """
+    Returns the xdist group of a test.
+
+    Args:
+        item (pytest.Item): Test item
+
+    Returns:
+        Optional[str]: Group name, or None if the test can run anywhere
+    """
+    if group_key in item.stash:
+        return item.stash[group_key]
+    return class_group(item)
+
+
+def uses_browser(item: pytest.Item) -> bool:
+    return not BROWSER_FIXTURES.isdisjoint(item.fixturenames)
+
+
+def available_memory_mb() -> Optional[int]:
+    # MemAvailable includes reclaimable page cache, which free pages do not
+    try:
+        with open(MEMINFO_PATH) as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        # Not available on Windows
+        return None
+
+
+def plan_workers(units: List[dict], cpus: int = None, memory_mb: int = None) -> int:
+    """
+    Returns the number of xdist workers for the selected work units.
+
+    Args:
+        units (List[dict]): Groups and ungrouped tests, each with a browser flag
+        cpus (int): Number of CPUs (default: os.cpu_count())
+        memory_mb (int): Available memory in MB (default: measured)
+
+    Returns:
+        int: Number of workers, 0 runs the tests in-process
+    """
+    cpus = cpus or os.cpu_count() or 1
+    limit = max(1, int(cpus * IO_WORKERS_PER_CPU))
+    if any(unit["browser"] for unit in units):
+        memory_mb = memory_mb if memory_mb is not None else available_memory_mb()
+        browser_limit = cpus
+        if memory_mb is not None:
+            browser_limit = min(cpus, memory_mb // BROWSER_WORKER_MB)
+        limit = min(limit, max(1, browser_limit))
+    workers = min(limit, len(units))
+    # A single worker only adds spin-up time
+    return workers if workers > 1 else 0
+
+
+def _units(workload: List[dict]) -> List[dict]:
+    units = {}
+    for index, test in enumerate(workload):
+        unit = units.setdefault(test["group"] or index, {"browser": False})
+        unit["browser"] = unit["browser"] or test["browser"]
+    return list(units.values())
+
+
+def probe_workload(config: pytest.Config) -> Optional[List[dict]]:
+    """
+    Collects the selected tests in a subprocess, before xdist starts workers.
+
+    Args:
+        config (pytest.Config): pytest configuration
+
+    Returns:
+        Optional[List[dict]]: Selected tests with group and browser flag,
+            None if collection failed
+    """
+    with tempfile.TemporaryDirectory(prefix="pytest-workload-") as directory:
+        report = Path(directory) / "workload.json"
+        command = [
+            sys.executable, "-m", "pytest",
+            *config.invocation_params.args,
+            "--collect-only", "-q", "-n", "0", "-p", "no:cacheprovider"
+        ]
+        try:
+            subprocess.run(
+                command,
+                cwd=config.invocation_params.dir,
+                env={**os.environ, WORKLOAD_REPORT_ENV: str(report)},
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=PROBE_TIMEOUT
+            )
+            return json.loads(report.read_text())
+        except (OSError, ValueError, subprocess.SubprocessError) as e:
+            logging.warning(f"Could not collect the workload, using xdist defaults: {e}")
+            return None
+
+
+def pytest_xdist_auto_num_workers(config):
+    """Sizes -n auto from the selected tests instead of the CPU count."""
+    if os.getenv("PYTEST_XDIST_AUTO_NUM_WORKERS") or config.option.collectonly:
+        return None
+    workload = probe_workload(config)
+    if workload is None:
+        return None
+    workers = plan_workers(_units(workload))
+    plan = f"Selected {len(workload)} tests, starting {workers or 'no'} xdist workers"
+    logging.info(plan)
+    # Runs before the terminal reporter exists
+    config.stash[worker_plan_key] = plan
+    return workers
+
+
+def pytest_report_header(config):
+    return config.stash.get(worker_plan_key, None)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Before xdist adds the group to node ids for --dist loadgroup
+    assign_groups(items)
+    for item in items:
+        name = group_name(item)
+        if name and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(name))
+
+
+def pytest_collection_finish(session):
+    report = os.getenv(WORKLOAD_REPORT_ENV)
+    if not report:
+        return
+    Path(report).write_text(json.dumps([
+        {"group": group_name(item), "browser": uses_browser(item)}
+        for item in session.items
+    ]))
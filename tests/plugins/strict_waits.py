@@ -0,0 +1,18 @@
+import pytest
+
+from tests.GUI.waits import STRICT_WAITS, find_fixed_sleeps
+
+
+def pytest_sessionstart(session):
+    """
+    Fails the session when STRICT_WAITS=true and a page object still pauses
+    for a fixed time instead of waiting for a condition.
+    """
+    if not STRICT_WAITS or hasattr(session.config, "workerinput"):
+        return
+    findings = find_fixed_sleeps()
+    if findings:
+        raise pytest.UsageError(
+            "Fixed sleeps in page objects, use tests/GUI/waits.py instead:\n"
+            + "\n".join(findings)
+        )